@@ -7,6 +7,7 @@ FastAPI dependency injection for services and common resources.
 from functools import lru_cache
 from typing import AsyncGenerator
 
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db_session
@@ -26,41 +27,47 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
-def get_alert_service() -> AlertService:
+# Services share one session per request. "function" scope commits it when
+# the route returns, before the response is sent, so a commit failure still
+# reaches the client and after-commit work never runs for a rolled-back write.
+DB_SESSION = Depends(get_db, scope="function")
+
+
+def get_alert_service(session: AsyncSession = DB_SESSION) -> AlertService:
     """Get AlertService dependency."""
     return AlertService(
-        alert_repo=AlertRepository(),
-        transaction_repo=TransactionRepository(),
+        alert_repo=AlertRepository(session),
+        transaction_repo=TransactionRepository(session),
     )
 
 
-def get_dashboard_service() -> DashboardService:
+def get_dashboard_service(session: AsyncSession = DB_SESSION) -> DashboardService:
     """Get DashboardService dependency."""
     return DashboardService(
-        alert_repo=AlertRepository(),
+        alert_repo=AlertRepository(session),
     )
 
 
-def get_investigation_service() -> InvestigationService:
+def get_investigation_service(session: AsyncSession = DB_SESSION) -> InvestigationService:
     """Get InvestigationService dependency."""
     return InvestigationService(
-        alert_repo=AlertRepository(),
-        transaction_repo=TransactionRepository(),
-        feedback_repo=FeedbackRepository(),
+        alert_repo=AlertRepository(session),
+        transaction_repo=TransactionRepository(session),
+        feedback_repo=FeedbackRepository(session),
     )
 
 
-def get_analytics_service() -> AnalyticsService:
+def get_analytics_service(session: AsyncSession = DB_SESSION) -> AnalyticsService:
     """Get AnalyticsService dependency."""
     return AnalyticsService(
-        alert_repo=AlertRepository(),
-        feedback_repo=FeedbackRepository(),
+        alert_repo=AlertRepository(session),
+        feedback_repo=FeedbackRepository(session),
     )
 
 
-def get_feedback_service() -> FeedbackService:
+def get_feedback_service(session: AsyncSession = DB_SESSION) -> FeedbackService:
     """Get FeedbackService dependency."""
     return FeedbackService(
-        feedback_repo=FeedbackRepository(),
-        alert_repo=AlertRepository(),
+        feedback_repo=FeedbackRepository(session),
+        alert_repo=AlertRepository(session),
     )
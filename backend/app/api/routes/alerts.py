@@ -5,7 +5,7 @@ Endpoints for alert management including listing, filtering, and detail views.
 """
 
 from fastapi import APIRouter, Depends, Query, Path, HTTPException
-from typing import Optional
+from typing import List, Optional
 
 from app.models.schemas import (
     AlertsListResponse,
@@ -13,10 +13,13 @@ from app.models.schemas import (
     AlertFilters,
     AlertSeverity,
     AlertStatus,
+    BulkStatusUpdateRequest,
+    BulkStatusUpdateResult,
 )
 from app.services.alert_service import AlertService
 from app.api.dependencies import get_alert_service
 from app.core.errors import NotFoundError
+from app.core.responses import ORJSONResponse
 
 router = APIRouter()
 
@@ -25,9 +28,10 @@ router = APIRouter()
 async def get_alerts(
     page: int = Query(default=1, ge=1, description="Page number"),
     limit: int = Query(default=10, ge=1, le=100, description="Items per page"),
-    severity: Optional[AlertSeverity] = Query(default=None, description="Filter by severity"),
-    status: Optional[AlertStatus] = Query(default=None, description="Filter by status"),
+    severity: Optional[List[AlertSeverity]] = Query(default=None, description="Filter by severity (repeat for several)"),
+    status: Optional[List[AlertStatus]] = Query(default=None, description="Filter by status (repeat for several)"),
     search: Optional[str] = Query(default=None, max_length=100, description="Search by ID or entity"),
+    cursor: Optional[str] = Query(default=None, description="Opaque next_cursor from the previous page"),
     service: AlertService = Depends(get_alert_service),
 ):
     """
@@ -37,20 +41,24 @@ async def get_alerts(
     - Severity (CRITICAL, HIGH, MEDIUM, LOW)
     - Status (ACTIVE, INVESTIGATING, RESOLVED, FALSE_POSITIVE)
     - Search term (Alert ID or Entity)
+    
+    Pass `cursor` (the previous response's `next_cursor`) to page by
+    keyset instead of `page`.
     """
     filters = AlertFilters(
         page=page,
         limit=limit,
-        severity=severity,
-        status=status,
+        severity=frozenset(severity) if severity else None,
+        status=frozenset(status) if status else None,
         search=search,
+        cursor=cursor,
     )
     
     result = await service.get_alerts(filters)
-    return AlertsListResponse(
+    return ORJSONResponse.from_model(AlertsListResponse(
         data=result.alerts,
         pagination=result.pagination,
-    )
+    ))
 
 
 @router.get("/{alert_id}", response_model=AlertDetailResponse)
@@ -74,6 +82,23 @@ async def get_alert_detail(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.patch("/status", response_model=BulkStatusUpdateResult)
+async def bulk_update_alert_status(
+    request: BulkStatusUpdateRequest,
+    service: AlertService = Depends(get_alert_service),
+):
+    """
+    Update the status of several alerts at once.
+    
+    Each change follows the same transition rules as the single-alert
+    endpoint. Valid changes are applied; the rest are listed in `rejected`
+    with a reason.
+    """
+    return await service.bulk_update_status(
+        [(change.alert_id, change.status) for change in request.updates]
+    )
+
+
 @router.patch("/{alert_id}/status")
 async def update_alert_status(
     alert_id: str = Path(..., description="Alert ID"),
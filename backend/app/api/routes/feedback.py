@@ -5,7 +5,7 @@ Endpoints for feedback history and analyst decision tracking.
 """
 
 from fastapi import APIRouter, Depends, Query, Path
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 
 from app.models.schemas import (
     FeedbackListResponse,
@@ -14,6 +14,7 @@ from app.models.schemas import (
 )
 from app.services.feedback_service import FeedbackService
 from app.api.dependencies import get_feedback_service
+from app.core.responses import ORJSONResponse
 
 router = APIRouter()
 
@@ -22,9 +23,10 @@ router = APIRouter()
 async def get_feedback_history(
     page: int = Query(default=1, ge=1, description="Page number"),
     limit: int = Query(default=20, ge=1, le=100, description="Items per page"),
-    decision: Optional[FeedbackDecision] = Query(default=None, description="Filter by decision"),
+    decision: Optional[List[FeedbackDecision]] = Query(default=None, description="Filter by decision (repeat for several)"),
     analyst: Optional[str] = Query(default=None, description="Filter by analyst"),
     range: Literal["7d", "30d", "90d", "all"] = Query(default="30d", description="Time range"),
+    cursor: Optional[str] = Query(default=None, description="Opaque next_cursor from the previous page"),
     service: FeedbackService = Depends(get_feedback_service),
 ):
     """
@@ -35,21 +37,25 @@ async def get_feedback_history(
     - Analyst notes
     - Resolution timestamp
     - Analyst name
+    
+    Pass `cursor` (the previous response's `next_cursor`) to page by
+    keyset instead of `page`.
     """
     filters = FeedbackFilters(
         page=page,
         limit=limit,
-        decision=decision,
+        decision=frozenset(decision) if decision else None,
         analyst=analyst,
         range=range,
+        cursor=cursor,
     )
     
     result = await service.get_feedback_history(filters)
-    return FeedbackListResponse(
+    return ORJSONResponse.from_model(FeedbackListResponse(
         data=result.feedback,
         pagination=result.pagination,
         summary=result.summary,
-    )
+    ))
 
 
 @router.get("/summary")
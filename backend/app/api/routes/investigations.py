@@ -4,7 +4,7 @@ Investigations API Routes
 Endpoints for managing fraud investigations and submitting decisions.
 """
 
-from fastapi import APIRouter, Depends, Path, HTTPException
+from fastapi import APIRouter, Depends, Path, HTTPException, Response
 from typing import Optional
 
 from app.models.schemas import (
@@ -13,6 +13,7 @@ from app.models.schemas import (
     InvestigationDecisionResponse,
     InvestigationNoteRequest,
 )
+from app.core.responses import NDJSONResponse, ORJSONResponse
 from app.services.investigation_service import InvestigationService
 from app.api.dependencies import get_investigation_service
 from app.core.errors import NotFoundError, BusinessRuleViolation
@@ -36,7 +37,7 @@ async def get_investigation(
     """
     try:
         investigation = await service.get_investigation(alert_id)
-        return InvestigationDetailResponse(data=investigation)
+        return ORJSONResponse.from_model(InvestigationDetailResponse(data=investigation))
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -67,12 +68,12 @@ async def submit_decision(
             notes=decision.notes,
             analyst_id=decision.analyst_id,
         )
-        return InvestigationDecisionResponse(
+        return ORJSONResponse.from_model(InvestigationDecisionResponse(
             success=True,
             alert_id=alert_id,
             updated_status=result.new_status,
             message=f"Decision recorded: {decision.decision}",
-        )
+        ))
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except BusinessRuleViolation as e:
@@ -115,7 +116,24 @@ async def get_investigation_history(
     - Decisions made
     """
     try:
-        history = await service.get_history(alert_id)
-        return {"alert_id": alert_id, "history": history}
+        body = await service.get_history_json(alert_id)
+        return Response(content=body, media_type="application/json")
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get("/{alert_id}/history/stream", response_class=NDJSONResponse)
+async def stream_investigation_history(
+    alert_id: str = Path(..., description="Alert ID"),
+    service: InvestigationService = Depends(get_investigation_service),
+):
+    """
+    Stream the investigation history as NDJSON, one timeline entry per line.
+    
+    Lets clients render long timelines progressively.
+    """
+    try:
+        entries = await service.iter_history(alert_id)
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    return NDJSONResponse(entries)
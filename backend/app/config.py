@@ -50,6 +50,7 @@ class Settings(BaseSettings):
     RISK_THRESHOLD_HIGH: float = 80.0
     RISK_THRESHOLD_MEDIUM: float = 50.0
     RISK_THRESHOLD_LOW: float = 20.0
+    DETECTION_ENGINE_MODE: Literal["full", "cascade"] = "full"
     
     # Rate Limiting
     RATE_LIMIT_REQUESTS: int = 100
@@ -0,0 +1,117 @@
+"""
+Caching
+=======
+Small in-process TTL cache for slowly-changing service responses.
+"""
+
+import asyncio
+import functools
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded mapping whose entries expire `ttl` seconds after being set.
+    
+    Not thread-safe; intended for use from a single event loop.
+    """
+    
+    def __init__(self, maxsize: int = 128, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for `key`, dropping it if it has expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._data[key]
+            return default
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store `value`, evicting expired then oldest entries when full."""
+        if key not in self._data and len(self._data) >= self.maxsize:
+            now = monotonic()
+            for stale in [k for k, (exp, _) in self._data.items() if exp <= now]:
+                del self._data[stale]
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+        self._data[key] = (monotonic() + self.ttl, value)
+    
+    def pop(self, key: Hashable) -> None:
+        """Drop the entry for `key`, if any."""
+        self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class _KeyLock:
+    """A cache key's fill lock and the number of callers holding or awaiting it."""
+    
+    __slots__ = ("lock", "users")
+    
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+def async_ttl_cache(
+    ttl: float = 60.0,
+    maxsize: int = 16,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Cache an async service method's result per argument tuple for `ttl` seconds.
+    
+    `self` is left out of the key because services are built per request.
+    Concurrent misses on the same key wait for a single computation, while
+    misses on different keys compute independently. Cached objects are shared
+    between requests and must not be mutated. The wrapper exposes the
+    underlying TTLCache as `.cache`.
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Fill locks for keys with callers in flight; an entry is dropped when
+        # its last caller leaves, not when the lock is released
+        locks: Dict[Hashable, _KeyLock] = {}
+        
+        @functools.wraps(func)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> T:
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            value = cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            
+            entry = locks.get(key)
+            if entry is None:
+                entry = locks[key] = _KeyLock()
+            entry.users += 1
+            try:
+                async with entry.lock:
+                    value = cache.get(key, _MISSING)
+                    if value is _MISSING:
+                        value = await func(self, *args, **kwargs)
+                        cache.set(key, value)
+            finally:
+                entry.users -= 1
+                if not entry.users:
+                    del locks[key]
+            return value
+        
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+    
+    return decorator
@@ -13,9 +13,15 @@ from structlog.types import Processor
 
 from app.config import settings
 
+# Minimum level passed through by the configured loggers. structlog's
+# defaults (before `setup_logging`) emit everything.
+_min_level = logging.NOTSET
+
 
 def setup_logging() -> None:
     """Configure structured logging for the application."""
+    global _min_level
+    _min_level = getattr(logging, settings.LOG_LEVEL.upper())
     
     # Determine processors based on environment
     if settings.LOG_FORMAT == "json":
@@ -42,9 +48,7 @@ def setup_logging() -> None:
             ),
             renderer,
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, settings.LOG_LEVEL.upper())
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(_min_level),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=True,
@@ -54,7 +58,7 @@ def setup_logging() -> None:
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, settings.LOG_LEVEL.upper()),
+        level=_min_level,
     )
     
     # Reduce noise from third-party libraries
@@ -76,6 +80,16 @@ def get_logger(name: str) -> structlog.BoundLogger:
     return structlog.get_logger(name)
 
 
+def is_log_enabled(level: int) -> bool:
+    """
+    Check whether log calls at `level` would be emitted.
+    
+    Guard hot-path log calls with this so their keyword payload is not
+    built when the level is filtered out.
+    """
+    return level >= _min_level
+
+
 class LogContext:
     """Context manager for adding temporary log context."""
     
@@ -7,8 +7,10 @@ Lightweight metrics collection for monitoring system health.
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
+import heapq
 import time
 from collections import defaultdict
+from operator import itemgetter
 
 from app.config import settings
 
@@ -126,11 +128,11 @@ class MetricsCollector:
             "alerts_resolved": self.alerts_resolved,
             "latencies": avg_latencies,
             "score_distribution": score_distribution,
-            "top_endpoints": sorted(
+            "top_endpoints": heapq.nlargest(
+                10,
                 self.request_counts.items(),
-                key=lambda x: x[1],
-                reverse=True,
-            )[:10],
+                key=itemgetter(1),
+            ),
         }
     
     def reset(self) -> None:
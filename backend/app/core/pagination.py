@@ -0,0 +1,27 @@
+"""
+Pagination
+==========
+Opaque keyset cursors for list endpoints.
+"""
+
+import base64
+from datetime import datetime
+from typing import Tuple
+
+from app.core.errors import ValidationError
+
+
+def encode_cursor(timestamp: datetime, row_id: str) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    raw = f"{timestamp.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor back into its (timestamp, row id) sort key."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode()
+        timestamp, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(timestamp), row_id
+    except ValueError as e:
+        raise ValidationError("Invalid pagination cursor", details={"cursor": cursor}) from e
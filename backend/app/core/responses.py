@@ -0,0 +1,57 @@
+"""
+Responses
+=========
+JSON response classes backed by orjson.
+"""
+
+from typing import Any, AsyncIterable, AsyncIterator
+
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson.
+    
+    Used as the application's default response class. NumPy scalars and
+    arrays serialize natively. Naive datetimes are emitted without an
+    offset, as Pydantic does, since the service produces local times.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+    
+    @classmethod
+    def from_model(cls, model: BaseModel, status_code: int = 200) -> "ORJSONResponse":
+        """
+        Serialize an already-built response schema directly.
+        
+        Returning this from a route skips FastAPI's re-validation of the
+        value against `response_model`; the route's `response_model` still
+        documents the payload. JSON-mode dumping keeps the wire format
+        identical to the default path.
+        """
+        return cls(content=model.model_dump(mode="json"), status_code=status_code)
+
+
+class NDJSONResponse(StreamingResponse):
+    """
+    Newline-delimited JSON streamed from an async iterable.
+    
+    Each item is serialized with orjson and sent as soon as it is produced,
+    so the full payload never has to be held in memory.
+    """
+    
+    media_type = "application/x-ndjson"
+    
+    def __init__(self, items: AsyncIterable[Any], status_code: int = 200):
+        super().__init__(self._encode(items), status_code=status_code)
+    
+    @staticmethod
+    async def _encode(items: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+        async for item in items:
+            yield orjson.dumps(item, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
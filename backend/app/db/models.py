@@ -299,7 +299,7 @@ class AlertModel(Base):
 
     __table_args__ = (
         Index("ix_alert_status_severity", "status", "severity"),
-        Index("ix_alert_detection_time", "detection_time"),
+        Index("ix_alert_detection_time_id", "detection_time", "id"),
         Index("ix_alert_entity_time", "entity", "detection_time"),
     )
 
@@ -512,6 +512,7 @@ class FeedbackModel(Base):
         Index("ix_feedback_decision_time", "decision", "resolved_at"),
         Index("ix_feedback_analyst", "analyst_id", "resolved_at"),
         Index("ix_feedback_training", "used_for_training"),
+        Index("ix_feedback_resolved_at_id", "resolved_at", "id"),
     )
 
 
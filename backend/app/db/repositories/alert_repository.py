@@ -5,17 +5,32 @@ Data access layer for alert operations.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple, Union
 
-from sqlalchemy import select, update, func, and_
+from sqlalchemy import select, update, func, and_, case, literal, tuple_
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import AlertModel
-from app.models.enums import AlertSeverity, AlertStatus
+from app.db.models import AlertModel, InvestigationModel
+from app.models.enums import AlertSeverity, AlertStatus, InvestigationAction
+from app.models.schemas import AlertFilters, InvestigationNote
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Columns a list card needs: the Alert schema fields plus id for keyset cursors.
+# Detail views load the full row through get_by_id.
+ALERT_LIST_COLUMNS = (
+    AlertModel.id,
+    AlertModel.alert_id,
+    AlertModel.detection_time,
+    AlertModel.entity,
+    AlertModel.entity_type,
+    AlertModel.risk_score,
+    AlertModel.severity,
+    AlertModel.status,
+)
+
 
 class AlertRepository:
     """Repository for alert database operations."""
@@ -32,30 +47,24 @@ class AlertRepository:
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
     
-    async def get_list(
-        self,
-        severity: Optional[AlertSeverity] = None,
-        status: Optional[AlertStatus] = None,
-        search: Optional[str] = None,
-        offset: int = 0,
-        limit: int = 10,
-    ) -> Tuple[List[AlertModel], int]:
-        """Get paginated list of alerts with filters."""
-        if not self.session:
-            return [], 0
-        
-        # Build base query
-        query = select(AlertModel)
-        count_query = select(func.count(AlertModel.id))
-        
-        # Apply filters
+    @staticmethod
+    def _filter_conditions(
+        severity: Union[AlertSeverity, Collection[AlertSeverity], None],
+        status: Union[AlertStatus, Collection[AlertStatus], None],
+        search: Optional[str],
+    ) -> List[Any]:
+        """Build WHERE conditions for alert list queries (sets match any member)."""
         conditions = []
         
-        if severity:
+        if isinstance(severity, AlertSeverity):
             conditions.append(AlertModel.severity == severity)
+        elif severity:
+            conditions.append(AlertModel.severity.in_(severity))
         
-        if status:
+        if isinstance(status, AlertStatus):
             conditions.append(AlertModel.status == status)
+        elif status:
+            conditions.append(AlertModel.status.in_(status))
         
         if search:
             conditions.append(
@@ -63,22 +72,93 @@ class AlertRepository:
                 AlertModel.entity.ilike(f"%{search}%")
             )
         
+        return conditions
+    
+    async def get_list(
+        self,
+        severity: Union[AlertSeverity, Collection[AlertSeverity], None] = None,
+        status: Union[AlertStatus, Collection[AlertStatus], None] = None,
+        search: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 10,
+    ) -> Tuple[List[Row], int]:
+        """
+        Get paginated list of alerts with filters.
+        
+        Rows carry only ALERT_LIST_COLUMNS; the total comes back with the
+        page via COUNT(*) OVER ().
+        """
+        if not self.session:
+            return [], 0
+        
+        # Build base query; the window count sees every filtered row before LIMIT
+        query = select(*ALERT_LIST_COLUMNS, func.count().over().label("total"))
+        
+        # Apply filters
+        conditions = self._filter_conditions(severity, status, search)
+        
         if conditions:
             query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
-        
-        # Get total count
-        count_result = await self.session.execute(count_query)
-        total = count_result.scalar_one()
         
         # Apply pagination and ordering (by detection_time for analyst relevance)
-        query = query.order_by(AlertModel.detection_time.desc())
+        query = query.order_by(AlertModel.detection_time.desc(), AlertModel.id.desc())
         query = query.offset(offset).limit(limit)
         
         result = await self.session.execute(query)
-        alerts = result.scalars().all()
+        rows = result.all()
+        
+        if rows:
+            return rows, rows[0].total
+        if not offset:
+            return [], 0
+        
+        # Past the last page: no row carries the total, so count separately
+        count_query = select(func.count(AlertModel.id))
+        if conditions:
+            count_query = count_query.where(and_(*conditions))
+        count_result = await self.session.execute(count_query)
+        return [], count_result.scalar_one()
+    
+    async def list(self, filters: AlertFilters) -> Tuple[List[Row], int]:
+        """Get one page of alerts matching API filters, newest first."""
+        return await self.get_list(
+            severity=filters.severity,
+            status=filters.status,
+            search=filters.search,
+            offset=(filters.page - 1) * filters.limit,
+            limit=filters.limit,
+        )
+    
+    async def list_after(
+        self,
+        filters: AlertFilters,
+        after: Tuple[datetime, str],
+    ) -> List[Row]:
+        """
+        Get the alerts that follow `after` = (detection_time, id), newest first.
+        
+        Keyset pagination: seeks the (detection_time, id) index instead of
+        skipping rows with OFFSET. Returns up to `filters.limit + 1` rows so
+        the caller can tell whether another page follows. No total is
+        counted; that would scan every matching row on each page.
+        """
+        if not self.session:
+            return []
+        
+        conditions = self._filter_conditions(filters.severity, filters.status, filters.search)
+        
+        query = (
+            select(*ALERT_LIST_COLUMNS)
+            .where(and_(
+                *conditions,
+                tuple_(AlertModel.detection_time, AlertModel.id) < tuple_(*after),
+            ))
+            .order_by(AlertModel.detection_time.desc(), AlertModel.id.desc())
+            .limit(filters.limit + 1)
+        )
         
-        return list(alerts), total
+        result = await self.session.execute(query)
+        return list(result.all())
     
     async def update_status(
         self,
@@ -98,6 +178,101 @@ class AlertRepository:
         result = await self.session.execute(query)
         return result.rowcount > 0
     
+    async def record_decision(
+        self,
+        alert: AlertModel,
+        new_status: AlertStatus,
+        records: Sequence[Any],
+    ) -> None:
+        """
+        Set a loaded alert's status and stage related rows in one flush.
+        
+        `records` are the decision's new audit/feedback rows; the session's
+        commit makes the status change and the rows land together.
+        """
+        if not self.session:
+            return
+        
+        alert.status = new_status
+        alert.updated_at = datetime.utcnow()
+        self.session.add_all(records)
+        await self.session.flush()
+    
+    async def add_notes(self, notes: Sequence[Tuple[str, InvestigationNote]]) -> int:
+        """
+        Append NOTE_ADDED audit entries for (alert_id, note) pairs in one flush.
+        
+        Alert IDs are resolved to row keys with a single query; notes for
+        unknown alerts are skipped. Returns the number of notes written.
+        """
+        if not self.session or not notes:
+            return 0
+        
+        query = (
+            select(AlertModel.alert_id, AlertModel.id)
+            .where(AlertModel.alert_id.in_({alert_id for alert_id, _ in notes}))
+        )
+        result = await self.session.execute(query)
+        row_ids = {row[0]: row[1] for row in result.all()}
+        
+        entries = [
+            InvestigationModel(
+                id=note.note_id,
+                alert_id=row_ids[alert_id],
+                action=InvestigationAction.NOTE_ADDED,
+                notes=note.content,
+                analyst_id=note.analyst_id,
+                created_at=note.timestamp,
+            )
+            for alert_id, note in notes
+            if alert_id in row_ids
+        ]
+        self.session.add_all(entries)
+        await self.session.flush()
+        return len(entries)
+    
+    async def get_statuses(self, alert_ids: Sequence[str]) -> Dict[str, AlertStatus]:
+        """Get the current status of each existing alert in one query."""
+        if not self.session:
+            return {}
+        
+        query = (
+            select(AlertModel.alert_id, AlertModel.status)
+            .where(AlertModel.alert_id.in_(alert_ids))
+        )
+        
+        result = await self.session.execute(query)
+        return {row[0]: row[1] for row in result.all()}
+    
+    async def apply_status_updates(
+        self,
+        changes: Sequence[Tuple[str, AlertStatus]],
+    ) -> int:
+        """
+        Set several alerts' statuses in a single UPDATE.
+        
+        `changes` is (alert_id, new_status) pairs; the new status is picked
+        per row with a CASE on alert_id.
+        """
+        if not self.session or not changes:
+            return 0
+        
+        new_statuses = {
+            alert_id: literal(new_status, AlertModel.status.type)
+            for alert_id, new_status in changes
+        }
+        query = (
+            update(AlertModel)
+            .where(AlertModel.alert_id.in_(new_statuses))
+            .values(
+                status=case(new_statuses, value=AlertModel.alert_id, else_=AlertModel.status),
+                updated_at=datetime.utcnow(),
+            )
+        )
+        
+        result = await self.session.execute(query)
+        return result.rowcount
+    
     async def get_count_by_severity(self) -> dict:
         """Get alert counts grouped by severity."""
         if not self.session:
@@ -5,18 +5,25 @@ Data access layer for feedback/resolution operations.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import Any, Collection, List, Optional, Tuple, Union
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from app.db.models import FeedbackModel
 from app.models.enums import FeedbackDecision
+from app.models.schemas import FeedbackFilters
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def range_to_days(range: str) -> Optional[int]:
+    """Convert an API time range ("7d", "30d", "90d", "all") to days."""
+    return None if range == "all" else int(range.rstrip("d"))
+
+
 class FeedbackRepository:
     """Repository for feedback database operations."""
     
@@ -41,26 +48,27 @@ class FeedbackRepository:
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
     
-    async def get_list(
-        self,
-        decision: Optional[FeedbackDecision] = None,
-        analyst: Optional[str] = None,
-        days: Optional[int] = None,
-        offset: int = 0,
-        limit: int = 20,
-    ) -> Tuple[List[FeedbackModel], int]:
-        """Get paginated feedback history."""
+    async def add(self, feedback: FeedbackModel) -> None:
+        """Insert a feedback record."""
         if not self.session:
-            return [], 0
-        
-        # Build query
-        query = select(FeedbackModel)
-        count_query = select(func.count(FeedbackModel.id))
+            return
         
+        self.session.add(feedback)
+        await self.session.flush()
+    
+    @staticmethod
+    def _filter_conditions(
+        decision: Union[FeedbackDecision, Collection[FeedbackDecision], None],
+        analyst: Optional[str],
+        days: Optional[int],
+    ) -> List[Any]:
+        """Build WHERE conditions for feedback list queries (sets match any member)."""
         conditions = []
         
-        if decision:
+        if isinstance(decision, FeedbackDecision):
             conditions.append(FeedbackModel.decision == decision)
+        elif decision:
+            conditions.append(FeedbackModel.decision.in_(decision))
         
         if analyst:
             conditions.append(FeedbackModel.analyst_id.ilike(f"%{analyst}%"))
@@ -69,56 +77,129 @@ class FeedbackRepository:
             start_date = datetime.utcnow() - timedelta(days=days)
             conditions.append(FeedbackModel.resolved_at >= start_date)
         
+        return conditions
+    
+    async def get_list(
+        self,
+        decision: Union[FeedbackDecision, Collection[FeedbackDecision], None] = None,
+        analyst: Optional[str] = None,
+        days: Optional[int] = None,
+        offset: int = 0,
+        limit: int = 20,
+        with_alert: bool = False,
+    ) -> Tuple[List[FeedbackModel], int]:
+        """
+        Get paginated feedback history.
+        
+        With `with_alert`, each record's alert is loaded in the same query.
+        The total comes back with the page via COUNT(*) OVER ().
+        """
+        if not self.session:
+            return [], 0
+        
+        # Build query; the window count sees every filtered row before LIMIT
+        query = select(FeedbackModel, func.count().over().label("total"))
+        
+        if with_alert:
+            query = query.options(joinedload(FeedbackModel.alert))
+        
+        conditions = self._filter_conditions(decision, analyst, days)
+        
         if conditions:
             query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
-        
-        # Get count
-        count_result = await self.session.execute(count_query)
-        total = count_result.scalar_one()
         
         # Get data — ordered by resolution time for analyst workflow
-        query = query.order_by(FeedbackModel.resolved_at.desc())
+        query = query.order_by(FeedbackModel.resolved_at.desc(), FeedbackModel.id.desc())
         query = query.offset(offset).limit(limit)
         
         result = await self.session.execute(query)
-        feedback = list(result.scalars().all())
+        rows = result.all()
         
-        return feedback, total
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        if not offset:
+            return [], 0
+        
+        # Past the last page: no row carries the total, so count separately
+        count_query = select(func.count(FeedbackModel.id))
+        if conditions:
+            count_query = count_query.where(and_(*conditions))
+        count_result = await self.session.execute(count_query)
+        return [], count_result.scalar_one()
+    
+    async def list(self, filters: FeedbackFilters) -> Tuple[List[FeedbackModel], int]:
+        """Get one page of feedback (with alerts) matching API filters, newest first."""
+        return await self.get_list(
+            decision=filters.decision,
+            analyst=filters.analyst,
+            days=range_to_days(filters.range),
+            offset=(filters.page - 1) * filters.limit,
+            limit=filters.limit,
+            with_alert=True,
+        )
     
-    async def get_summary_stats(self, days: int = 7) -> dict:
-        """Get summary statistics for feedback."""
+    async def list_after(
+        self,
+        filters: FeedbackFilters,
+        after: Tuple[datetime, str],
+    ) -> List[FeedbackModel]:
+        """
+        Get the feedback (with alerts) that follows `after` = (resolved_at, id).
+        
+        Keyset pagination: seeks the (resolved_at, id) index instead of
+        skipping rows with OFFSET. Returns up to `filters.limit + 1` rows so
+        the caller can tell whether another page follows. No total is
+        counted; that would scan every matching record on each page.
+        """
         if not self.session:
-            return {}
+            return []
         
-        start_date = datetime.utcnow() - timedelta(days=days)
+        conditions = self._filter_conditions(
+            filters.decision, filters.analyst, range_to_days(filters.range)
+        )
         
         query = (
-            select(
-                func.count(FeedbackModel.id).label('total'),
-                func.sum(
-                    func.case(
-                        (FeedbackModel.decision == FeedbackDecision.FRAUD, 1),
-                        else_=0
-                    )
-                ).label('frauds'),
-                func.sum(
-                    func.case(
-                        (FeedbackModel.decision == FeedbackDecision.FALSE_POSITIVE, 1),
-                        else_=0
-                    )
-                ).label('false_positives'),
-            )
-            .where(FeedbackModel.resolved_at >= start_date)
+            select(FeedbackModel)
+            .options(joinedload(FeedbackModel.alert))
+            .where(and_(
+                *conditions,
+                tuple_(FeedbackModel.resolved_at, FeedbackModel.id) < tuple_(*after),
+            ))
+            .order_by(FeedbackModel.resolved_at.desc(), FeedbackModel.id.desc())
+            .limit(filters.limit + 1)
         )
         
         result = await self.session.execute(query)
-        row = result.one()
+        return list(result.scalars().all())
+    
+    async def get_count_by_decision(self, days: Optional[int] = 7) -> dict:
+        """Get feedback counts grouped by decision (all time when `days` is None)."""
+        if not self.session:
+            return {}
+        
+        query = (
+            select(FeedbackModel.decision, func.count(FeedbackModel.id))
+            .group_by(FeedbackModel.decision)
+        )
+        
+        if days:
+            start_date = datetime.utcnow() - timedelta(days=days)
+            query = query.where(FeedbackModel.resolved_at >= start_date)
+        
+        result = await self.session.execute(query)
+        return {row[0]: row[1] for row in result.all()}
+    
+    async def get_summary_stats(self, days: Optional[int] = 7) -> dict:
+        """Get summary statistics for feedback (all time when `days` is None)."""
+        if not self.session:
+            return {}
+        
+        counts = await self.get_count_by_decision(days)
         
         return {
-            "total": row.total or 0,
-            "frauds": row.frauds or 0,
-            "false_positives": row.false_positives or 0,
+            "total": sum(counts.values()),
+            "frauds": counts.get(FeedbackDecision.FRAUD, 0),
+            "false_positives": counts.get(FeedbackDecision.FALSE_POSITIVE, 0),
         }
     
     async def get_by_analyst(
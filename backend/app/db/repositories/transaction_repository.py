@@ -10,7 +10,7 @@ from typing import List, Optional
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import TransactionModel
+from app.db.models import AlertModel, TransactionModel
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -33,6 +33,19 @@ class TransactionRepository:
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
     
+    async def get_for_alert(self, alert_id: str) -> Optional[TransactionModel]:
+        """Get the transaction that triggered an alert (by business alert_id)."""
+        if not self.session:
+            return None
+        
+        query = (
+            select(TransactionModel)
+            .join(AlertModel, AlertModel.transaction_id == TransactionModel.id)
+            .where(AlertModel.alert_id == alert_id)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+    
     async def get_by_account(
         self,
         account_id: str,
@@ -5,7 +5,7 @@ Async SQLAlchemy session factory and lifecycle management.
 """
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -21,15 +21,24 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 
-# Create async engine (PostgreSQL via asyncpg)
+def _engine_options(url: str) -> Dict[str, Any]:
+    """Pool settings for server databases; SQLite (aiosqlite) uses its dialect defaults."""
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": True,  # verify connections before use (handles RDS idle drops)
+    }
+
+
+# Create async engine (PostgreSQL via asyncpg, or SQLite via aiosqlite for local runs)
 engine: AsyncEngine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DATABASE_ECHO,
     future=True,
-    pool_size=settings.DATABASE_POOL_SIZE,
-    max_overflow=settings.DATABASE_MAX_OVERFLOW,
-    pool_recycle=settings.DATABASE_POOL_RECYCLE,
-    pool_pre_ping=True,  # verify connections before use (handles RDS idle drops)
+    **_engine_options(settings.DATABASE_URL),
 )
 
 # Session factory
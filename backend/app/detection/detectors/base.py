@@ -6,7 +6,21 @@ Abstract base class for all fraud detectors.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Any, List
+from typing import Dict, Any, Sequence, Tuple, Union
+
+from app.detection.features.feature_engineer import Features
+
+# Either a ready string or a (format template, value) pair rendered on demand,
+# so numeric formatting is only paid for explanations that are displayed
+Explanation = Union[str, Tuple[str, Any]]
+
+
+def render_explanation(explanation: Explanation) -> str:
+    """Render an explanation to its display string."""
+    if isinstance(explanation, str):
+        return explanation
+    template, value = explanation
+    return template.format(value)
 
 
 @dataclass
@@ -14,7 +28,7 @@ class DetectionResult:
     """Result from a detector."""
     score: float  # 0-100 risk score
     confidence: float = 1.0  # 0-1 confidence in the score
-    explanations: List[str] = field(default_factory=list)
+    explanations: Sequence[Explanation] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -38,12 +52,12 @@ class BaseDetector(ABC):
         return "1.0.0"
     
     @abstractmethod
-    async def detect(self, features: Dict[str, Any]) -> DetectionResult:
+    async def detect(self, features: Features) -> DetectionResult:
         """
         Analyze features and produce a risk score.
         
         Args:
-            features: Dictionary of computed features
+            features: Typed tuple of computed features
         
         Returns:
             DetectionResult with score, confidence, and explanations
@@ -56,7 +70,7 @@ class BaseDetector(ABC):
             return 50.0
         
         normalized = ((raw_score - min_val) / (max_val - min_val)) * 100
-        return max(0.0, min(100.0, normalized))
+        return 0.0 if normalized < 0.0 else (100.0 if normalized > 100.0 else normalized)
     
     def clamp_score(self, score: float) -> float:
         """Clamp score to valid range."""
@@ -5,10 +5,12 @@ Behavioral pattern analysis detector.
 Compares current transaction against historical entity behavior.
 """
 
-from typing import Dict, Any, List
+from typing import List
+import logging
 
-from app.detection.detectors.base import BaseDetector, DetectionResult
-from app.core.logging import get_logger
+from app.detection.detectors.base import BaseDetector, DetectionResult, Explanation
+from app.detection.features.feature_engineer import Features
+from app.core.logging import get_logger, is_log_enabled
 
 logger = get_logger(__name__)
 
@@ -29,77 +31,78 @@ class BehavioralDetector(BaseDetector):
     def name(self) -> str:
         return "behavioral"
     
-    async def detect(self, features: Dict[str, Any]) -> DetectionResult:
+    async def detect(self, features: Features) -> DetectionResult:
         """Analyze behavioral patterns."""
         score = 0.0
-        explanations: List[str] = []
+        explanations: List[Explanation] = []
         
         # 1. Spending Pattern Deviation
-        amount_pct_deviation = features.get("amount_pct_from_avg", 0)
+        amount_pct_deviation = features.amount_pct_from_avg
         if amount_pct_deviation > 200:  # More than 200% above average
             contribution = min(25, (amount_pct_deviation - 200) / 20)
             score += contribution
-            explanations.append(f"Spending {amount_pct_deviation:.0f}% above typical")
+            explanations.append(("Spending {:.0f}% above typical", amount_pct_deviation))
         
         # 2. New Destination Analysis
-        is_new_destination = features.get("is_new_destination", False)
+        is_new_destination = features.is_new_destination
         if is_new_destination:
             score += 15
             explanations.append("First-time transaction destination")
         
         # 3. Channel Behavior
-        is_new_channel = features.get("is_new_channel", False)
+        is_new_channel = features.is_new_channel
         if is_new_channel:
             score += 10
             explanations.append("New transaction channel used")
         
         # 4. Time Pattern Deviation
-        time_pattern_score = features.get("time_pattern_deviation", 0)
+        time_pattern_score = features.time_pattern_deviation
         if time_pattern_score > 50:
             contribution = time_pattern_score * 0.2
             score += contribution
             explanations.append("Unusual time pattern for this entity")
         
         # 5. Frequency Deviation
-        frequency_zscore = features.get("frequency_zscore", 0)
+        frequency_zscore = features.frequency_zscore
         if abs(frequency_zscore) > 2:
             contribution = min(20, abs(frequency_zscore) * 5)
             score += contribution
             if frequency_zscore > 0:
-                explanations.append(f"Transaction frequency {abs(frequency_zscore):.1f}x higher than usual")
+                explanations.append(("Transaction frequency {:.1f}x higher than usual", abs(frequency_zscore)))
             else:
                 # Unusually low frequency might indicate dormant account takeover
                 explanations.append("Activity after dormant period")
         
         # 6. Geographic Pattern
-        is_new_location = features.get("is_new_geo_location", False)
-        location_distance = features.get("location_distance_km", 0)
+        is_new_location = features.is_new_geo_location
+        location_distance = features.location_distance_km
         
         if is_new_location and location_distance > 500:
             contribution = min(25, location_distance / 100)
             score += contribution
-            explanations.append(f"Transaction from new location ({location_distance:.0f}km away)")
+            explanations.append(("Transaction from new location ({:.0f}km away)", location_distance))
         
         # 7. Account Age Factor
-        account_age_days = features.get("account_age_days", 365)
+        account_age_days = features.account_age_days
         if account_age_days < 30:
             # New accounts are higher risk
             score += 10
             explanations.append("New account (less than 30 days old)")
         
         # Normalize
-        final_score = self.clamp_score(score)
+        final_score = 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
         
         # Confidence based on historical data availability
-        has_history = features.get("has_historical_data", False)
+        has_history = features.has_historical_data
         confidence = 0.9 if has_history else 0.5
         
-        logger.debug(
-            "Behavioral detection complete",
-            score=final_score,
-            confidence=confidence,
-            explanations=explanations,
-        )
+        if is_log_enabled(logging.DEBUG):
+            logger.debug(
+                "Behavioral detection complete",
+                score=final_score,
+                confidence=confidence,
+                explanations=explanations,
+            )
         
         return DetectionResult(
             score=final_score,
@@ -5,14 +5,42 @@ Machine learning-based fraud detector.
 Uses trained models for anomaly detection.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, List, Tuple
 import random
+import logging
+
+import numpy as np
 
 from app.detection.detectors.base import BaseDetector, DetectionResult
-from app.core.logging import get_logger
+from app.detection.features.feature_engineer import Features
+from app.core.logging import get_logger, is_log_enabled
 
 logger = get_logger(__name__)
 
+# Model input vector layout (index -> feature)
+AMOUNT, TIME, VELOCITY, GEO, DEVICE, DESTINATION, FREQUENCY, ACCOUNT_AGE = range(8)
+
+# Per-feature score bonuses for the mock model: BONUS_HI above THRESH_HI,
+# otherwise BONUS_LO above THRESH_LO. Unused tiers are disabled with inf.
+_INF = np.inf
+THRESH_HI = np.array([0.8, _INF, 0.7, 0.7, 0.5, 0.5, _INF, _INF])
+BONUS_HI = np.array([30.0, 0.0, 20.0, 15.0, 10.0, 10.0, 0.0, 0.0])
+THRESH_LO = np.array([0.5, _INF, _INF, _INF, _INF, _INF, _INF, _INF])
+BONUS_LO = np.array([15.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+
+# Explanation signals in output order: (vector index, threshold, text).
+# Signal i sets bit i of the explanation mask.
+EXPLANATION_SIGNALS = (
+    (AMOUNT, 0.7, "ML: Unusual transaction amount pattern"),
+    (VELOCITY, 0.6, "ML: Elevated transaction frequency detected"),
+    (GEO, 0.6, "ML: Geographic pattern anomaly"),
+    (DEVICE, 0.5, "ML: Device fingerprint risk signal"),
+    (FREQUENCY, 0.7, "ML: Behavioral frequency anomaly"),
+)
+_SIGNAL_INDEX = np.array([index for index, _, _ in EXPLANATION_SIGNALS])
+_SIGNAL_THRESHOLD = np.array([threshold for _, threshold, _ in EXPLANATION_SIGNALS])
+_SIGNAL_BITS = 1 << np.arange(len(EXPLANATION_SIGNALS))
+
 
 class MLDetector(BaseDetector):
     """
@@ -29,6 +57,7 @@ class MLDetector(BaseDetector):
         super().__init__()
         self.model = None
         self.model_loaded = False
+        self._explanation_catalog = self._build_explanation_catalog()
         self._load_model()
     
     @property
@@ -39,6 +68,18 @@ class MLDetector(BaseDetector):
     def version(self) -> str:
         return "3.0.0"  # Model version
     
+    @staticmethod
+    def _build_explanation_catalog() -> Dict[int, Tuple[str, ...]]:
+        """Precompute the explanation list for every signal mask."""
+        return {
+            mask: tuple(
+                text
+                for bit, (_, _, text) in enumerate(EXPLANATION_SIGNALS)
+                if mask & (1 << bit)
+            )
+            for mask in range(1 << len(EXPLANATION_SIGNALS))
+        }
+    
     def _load_model(self) -> None:
         """
         Load the ML model.
@@ -59,7 +100,7 @@ class MLDetector(BaseDetector):
             logger.error("Failed to load ML model", error=str(e))
             self.model_loaded = False
     
-    async def detect(self, features: Dict[str, Any]) -> DetectionResult:
+    async def detect(self, features: Features) -> DetectionResult:
         """Run ML model prediction."""
         
         if not self.model_loaded:
@@ -69,20 +110,18 @@ class MLDetector(BaseDetector):
                 explanations=["ML model unavailable"],
             )
         
-        # Extract ML features
-        ml_features = self._prepare_features(features)
-        
-        # Make prediction (mock for MVP)
-        score, confidence = self._predict(ml_features)
+        # Build the model input and score it in one pass (mock for MVP)
+        score, confidence, ml_features = self._predict_from_raw(features)
         
         # Generate explanations based on feature importance
         explanations = self._generate_explanations(ml_features, score)
         
-        logger.debug(
-            "ML detection complete",
-            score=score,
-            confidence=confidence,
-        )
+        if is_log_enabled(logging.DEBUG):
+            logger.debug(
+                "ML detection complete",
+                score=score,
+                confidence=confidence,
+            )
         
         return DetectionResult(
             score=score,
@@ -95,62 +134,42 @@ class MLDetector(BaseDetector):
             },
         )
     
-    def _prepare_features(self, raw_features: Dict[str, Any]) -> Dict[str, float]:
-        """
-        Prepare features for ML model input.
-        
-        Handles:
-        - Feature normalization
-        - Missing value imputation
-        - One-hot encoding
-        """
-        ml_features = {
-            "amount_normalized": raw_features.get("amount_zscore", 0) / 3,
-            "time_risk": 1.0 if raw_features.get("is_unusual_hour", False) else 0.0,
-            "velocity": min(1.0, raw_features.get("hourly_transaction_count", 0) / 10),
-            "geo_risk": raw_features.get("geo_risk_score", 50) / 100,
-            "device_risk": 1.0 if raw_features.get("is_new_device", False) else 0.0,
-            "destination_risk": 1.0 if raw_features.get("is_new_destination", False) else 0.0,
-            "frequency_deviation": abs(raw_features.get("frequency_zscore", 0)) / 3,
-            "account_age_risk": 1.0 if raw_features.get("account_age_days", 365) < 30 else 0.0,
-        }
-        
-        return ml_features
-    
-    def _predict(self, features: Dict[str, float]) -> tuple[float, float]:
+    def _predict_from_raw(
+        self,
+        raw_features: Features,
+    ) -> Tuple[float, float, np.ndarray]:
         """
-        Make prediction using the ML model.
+        Prepare the model input vector and make a prediction.
         
-        Returns (score, confidence).
+        Returns (score, confidence, feature vector). The vector is laid out
+        by the AMOUNT..ACCOUNT_AGE indices.
         
         In production, this would call model.predict() and model.predict_proba()
         """
+        features = np.array([
+            raw_features.amount_zscore / 3,
+            1.0 if raw_features.is_unusual_hour else 0.0,
+            min(1.0, raw_features.hourly_transaction_count / 10),
+            raw_features.geo_risk_score / 100,
+            1.0 if raw_features.is_new_device else 0.0,
+            1.0 if raw_features.is_new_destination else 0.0,
+            abs(raw_features.frequency_zscore) / 3,
+            1.0 if raw_features.account_age_days < 30 else 0.0,
+        ])
+        
         # For MVP: Generate realistic-looking score based on feature values
         # This simulates what a trained model would output
-        
-        base_score = 20.0
-        
-        # High-risk signals
-        if features["amount_normalized"] > 0.8:
-            base_score += 30
-        elif features["amount_normalized"] > 0.5:
-            base_score += 15
-        
-        if features["velocity"] > 0.7:
-            base_score += 20
-        
-        if features["geo_risk"] > 0.7:
-            base_score += 15
-        
-        if features["device_risk"] > 0.5:
-            base_score += 10
-        
-        if features["destination_risk"] > 0.5:
-            base_score += 10
+        contributions = np.where(
+            features > THRESH_HI,
+            BONUS_HI,
+            np.where(features > THRESH_LO, BONUS_LO, 0.0),
+        )
+        base_score = 20.0 + float(contributions.sum())
         
         # Add some randomness to simulate model prediction variance
         noise = random.uniform(-5, 5)
-        final_score = self.clamp_score(base_score + noise)
+        final_score = base_score + noise
+        final_score = 0.0 if final_score < 0.0 else (100.0 if final_score > 100.0 else final_score)
         
         # Confidence is high when signals are clear (very high or very low score)
         if final_score > 80 or final_score < 30:
@@ -160,11 +179,11 @@ class MLDetector(BaseDetector):
         else:
             confidence = 0.6
         
-        return final_score, confidence
+        return final_score, confidence, features
     
     def _generate_explanations(
         self,
-        features: Dict[str, float],
+        features: np.ndarray,
         score: float,
     ) -> List[str]:
         """
@@ -172,28 +191,14 @@ class MLDetector(BaseDetector):
         
         In production, use SHAP or LIME for model interpretability.
         """
-        explanations = []
-        
         if score < 40:
-            return explanations  # Low risk, no explanations needed
-        
-        # Feature importance (simulated)
-        if features["amount_normalized"] > 0.7:
-            explanations.append("ML: Unusual transaction amount pattern")
-        
-        if features["velocity"] > 0.6:
-            explanations.append("ML: Elevated transaction frequency detected")
-        
-        if features["geo_risk"] > 0.6:
-            explanations.append("ML: Geographic pattern anomaly")
-        
-        if features["device_risk"] > 0.5:
-            explanations.append("ML: Device fingerprint risk signal")
+            return []  # Low risk, no explanations needed
         
-        if features["frequency_deviation"] > 0.7:
-            explanations.append("ML: Behavioral frequency anomaly")
+        # Feature importance (simulated), looked up by which signals fired
+        fired = features[_SIGNAL_INDEX] > _SIGNAL_THRESHOLD
+        mask = int(_SIGNAL_BITS[fired].sum())
         
-        if not explanations and score > 50:
-            explanations.append("ML: Combined risk factors elevated")
+        if not mask:
+            return ["ML: Combined risk factors elevated"] if score > 50 else []
         
-        return explanations
+        return list(self._explanation_catalog[mask])
@@ -5,13 +5,22 @@ Rule-based and statistical anomaly detection.
 Uses Z-scores, thresholds, and basic statistical analysis.
 """
 
-from typing import Dict, Any, List
+from typing import Final, List
+import logging
 
-from app.detection.detectors.base import BaseDetector, DetectionResult
-from app.core.logging import get_logger
+from app.detection.detectors.base import BaseDetector, DetectionResult, Explanation
+from app.detection.features.feature_engineer import Features
+from app.core.logging import get_logger, is_log_enabled
 
 logger = get_logger(__name__)
 
+# Thresholds (module-level so the hot path reads globals, not instance attributes)
+HIGH_AMOUNT_THRESHOLD: Final = 10_000.0  # USD
+ZSCORE_THRESHOLD: Final = 3.0
+VELOCITY_THRESHOLD: Final = 5  # transactions per hour
+GEO_RISK_THRESHOLD: Final = 50.0
+GEO_RISK_HIGH: Final = 80.0
+
 
 class StatisticalDetector(BaseDetector):
     """
@@ -24,79 +33,80 @@ class StatisticalDetector(BaseDetector):
     - Threshold breaches
     """
     
-    # Thresholds
-    HIGH_AMOUNT_THRESHOLD = 10000  # USD
-    ZSCORE_THRESHOLD = 3.0
-    VELOCITY_THRESHOLD = 5  # transactions per hour
+    # Thresholds (kept as class attributes for backwards compatibility)
+    HIGH_AMOUNT_THRESHOLD = HIGH_AMOUNT_THRESHOLD
+    ZSCORE_THRESHOLD = ZSCORE_THRESHOLD
+    VELOCITY_THRESHOLD = VELOCITY_THRESHOLD
     
     @property
     def name(self) -> str:
         return "statistical"
     
-    async def detect(self, features: Dict[str, Any]) -> DetectionResult:
+    async def detect(self, features: Features) -> DetectionResult:
         """Run statistical analysis on features."""
         score = 0.0
-        explanations: List[str] = []
+        explanations: List[Explanation] = []
+        append = explanations.append
         
-        # 1. Amount Analysis
-        amount = features.get("amount", 0)
-        amount_zscore = features.get("amount_zscore", 0)
+        # Read each feature once
+        amount = features.amount
+        amount_zscore = features.amount_zscore
+        hourly_count = features.hourly_transaction_count
+        geo_risk = features.geo_risk_score
         
-        if amount > self.HIGH_AMOUNT_THRESHOLD:
-            contribution = min(30, (amount / self.HIGH_AMOUNT_THRESHOLD) * 15)
+        # 1. Amount Analysis
+        if amount > HIGH_AMOUNT_THRESHOLD:
+            contribution = min(30, (amount / HIGH_AMOUNT_THRESHOLD) * 15)
             score += contribution
-            explanations.append(f"High transaction amount: ${amount:,.2f}")
+            append(("High transaction amount: ${:,.2f}", amount))
         
-        if abs(amount_zscore) > self.ZSCORE_THRESHOLD:
+        if abs(amount_zscore) > ZSCORE_THRESHOLD:
             contribution = min(25, abs(amount_zscore) * 5)
             score += contribution
-            explanations.append(f"Amount deviation: {amount_zscore:.1f}σ from mean")
+            append(("Amount deviation: {:.1f}σ from mean", amount_zscore))
         
         # 2. Time Pattern Analysis
-        is_unusual_hour = features.get("is_unusual_hour", False)
-        if is_unusual_hour:
+        if features.is_unusual_hour:
             score += 15
-            explanations.append("Transaction at unusual hour")
+            append("Transaction at unusual hour")
         
         # 3. Velocity Check
-        hourly_count = features.get("hourly_transaction_count", 0)
-        if hourly_count > self.VELOCITY_THRESHOLD:
-            contribution = min(20, (hourly_count - self.VELOCITY_THRESHOLD) * 5)
+        if hourly_count > VELOCITY_THRESHOLD:
+            contribution = min(20, (hourly_count - VELOCITY_THRESHOLD) * 5)
             score += contribution
-            explanations.append(f"High transaction velocity: {hourly_count}/hour")
+            append(("High transaction velocity: {}/hour", hourly_count))
         
         # 4. Geographic Risk
-        geo_risk = features.get("geo_risk_score", 0)
-        if geo_risk > 50:
+        if geo_risk > GEO_RISK_THRESHOLD:
             contribution = geo_risk * 0.2
             score += contribution
-            if geo_risk > 80:
-                explanations.append("High-risk geographic location")
+            if geo_risk > GEO_RISK_HIGH:
+                append("High-risk geographic location")
         
         # 5. Device Risk
-        is_new_device = features.get("is_new_device", False)
-        if is_new_device:
+        if features.is_new_device:
             score += 10
-            explanations.append("New device fingerprint")
+            append("New device fingerprint")
         
         # Normalize and clamp
-        final_score = self.clamp_score(score)
+        final_score = 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
         
         # Confidence based on data availability
         data_points = sum([
-            1 if features.get("amount") is not None else 0,
-            1 if features.get("amount_zscore") is not None else 0,
-            1 if features.get("hourly_transaction_count") is not None else 0,
-            1 if features.get("geo_risk_score") is not None else 0,
+            1 if amount is not None else 0,
+            1 if amount_zscore is not None else 0,
+            1 if hourly_count is not None else 0,
+            1 if geo_risk is not None else 0,
         ])
         confidence = min(1.0, data_points / 3)
         
-        logger.debug(
-            "Statistical detection complete",
-            score=final_score,
-            confidence=confidence,
-            explanations=explanations,
-        )
+        if is_log_enabled(logging.DEBUG):
+            logger.debug(
+                "Statistical detection complete",
+                score=final_score,
+                confidence=confidence,
+                explanations=explanations,
+            )
         
         return DetectionResult(
             score=final_score,
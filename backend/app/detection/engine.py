@@ -6,21 +6,32 @@ Coordinates feature engineering, multiple detectors, and risk scoring.
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Literal, Optional, Sequence
 from datetime import datetime
+from time import perf_counter
+import logging
 
-from app.detection.detectors.base import BaseDetector, DetectionResult
+from app.detection.detectors.base import (
+    BaseDetector,
+    DetectionResult,
+    Explanation,
+    render_explanation,
+)
 from app.detection.detectors.statistical import StatisticalDetector
 from app.detection.detectors.behavioral import BehavioralDetector
 from app.detection.detectors.ml_detector import MLDetector
 from app.detection.scoring.risk_scorer import RiskScorer
-from app.detection.features.feature_engineer import FeatureEngineer
+from app.detection.features.feature_engineer import FeatureEngineer, Features
 from app.models.enums import AlertSeverity
-from app.core.logging import get_logger
+from app.config import settings
+from app.core.logging import get_logger, is_log_enabled
 from app.core.observability import metrics
 
 logger = get_logger(__name__)
 
+# "full" runs every detector; "cascade" stops once the alert decision is fixed
+EngineMode = Literal["full", "cascade"]
+
 
 @dataclass
 class TransactionInput:
@@ -48,8 +59,13 @@ class DetectionOutput:
     should_alert: bool
     detector_scores: Dict[str, float]
     feature_values: Dict[str, Any]
-    explanations: List[str]
+    explanations: Sequence[Explanation]  # strings or unformatted (template, value) pairs
     processing_time_ms: float
+    
+    @property
+    def rendered_explanations(self) -> List[str]:
+        """Human-readable explanations, formatted on access."""
+        return [render_explanation(e) for e in self.explanations]
 
 
 class DetectionEngine:
@@ -61,14 +77,21 @@ class DetectionEngine:
     2. Multiple detector execution
     3. Score aggregation
     4. Alert decision
+    
+    In "cascade" mode detectors run cheapest-first and the remaining ones are
+    skipped once no possible score from them could flip the alert decision.
+    Skipped detectors are absent from `detector_scores`, and `risk_score` is
+    the composite of the detectors that ran. Use "full" mode for exact scores.
     """
     
     def __init__(
         self,
         risk_threshold_alert: float = 50.0,
         detector_weights: Optional[Dict[str, float]] = None,
+        engine_mode: Optional[EngineMode] = None,
     ):
         self.risk_threshold_alert = risk_threshold_alert
+        self.engine_mode: EngineMode = engine_mode or settings.DETECTION_ENGINE_MODE
         
         # Initialize components
         self.feature_engineer = FeatureEngineer()
@@ -88,41 +111,57 @@ class DetectionEngine:
             "ml": 0.40,
         }
         
+        # Total weight of the detectors that still run after each position
+        self._remaining_weights = tuple(
+            sum(self.detector_weights.get(d.name, 0.0) for d in self.detectors[i + 1:])
+            for i in range(len(self.detectors))
+        )
+        
         logger.info(
             "Detection engine initialized",
             detectors=[d.name for d in self.detectors],
             threshold=risk_threshold_alert,
+            engine_mode=self.engine_mode,
         )
     
     async def process_transaction(
         self,
         transaction: TransactionInput,
+        features: Optional[Features] = None,
     ) -> DetectionOutput:
         """
         Process a single transaction through the detection pipeline.
         
+        `features` may be passed in when already extracted (e.g. by
+        `batch_process`); otherwise they are extracted here.
+        
         Flow:
         1. Feature Engineering → Extract meaningful features
         2. Detector Execution → Run all detectors in parallel
         3. Score Aggregation → Combine detector scores
         4. Alert Decision → Determine if alert should be raised
         """
-        import time
-        start_time = time.perf_counter()
+        start_time = perf_counter()
         
         logger.info("Processing transaction", transaction_id=transaction.transaction_id)
         
         try:
             # Step 1: Feature Engineering
-            features = await self.feature_engineer.extract_features(transaction)
+            if features is None:
+                features = await self.feature_engineer.extract_features(transaction)
+            
+            # Step 2: Run Detectors, accumulating the weighted average,
+            # per-detector scores and explanations in the same pass
+            detector_scores: Dict[str, float] = {}
+            explanations: List[Explanation] = []
+            weighted_sum = 0.0
+            total_weight = 0.0
             
-            # Step 2: Run Detectors
-            detector_results: Dict[str, DetectionResult] = {}
+            last_index = len(self.detectors) - 1
             
-            for detector in self.detectors:
+            for index, detector in enumerate(self.detectors):
                 try:
                     result = await detector.detect(features)
-                    detector_results[detector.name] = result
                 except Exception as e:
                     logger.error(
                         "Detector failed",
@@ -130,25 +169,42 @@ class DetectionEngine:
                         error=str(e),
                     )
                     # Use neutral score on failure
-                    detector_results[detector.name] = DetectionResult(
+                    result = DetectionResult(
                         score=50.0,
                         confidence=0.0,
                         explanations=["Detector unavailable"],
                     )
+                
+                # Adjust weight by confidence
+                effective_weight = self.detector_weights.get(detector.name, 0.0) * result.confidence
+                weighted_sum += result.score * effective_weight
+                total_weight += effective_weight
+                detector_scores[detector.name] = result.score
+                explanations.extend(result.explanations)
+                
+                if (
+                    self.engine_mode == "cascade"
+                    and index < last_index
+                    and self._decision_locked(
+                        weighted_sum, total_weight, self._remaining_weights[index]
+                    )
+                ):
+                    if is_log_enabled(logging.DEBUG):
+                        logger.debug(
+                            "Alert decision locked, skipping remaining detectors",
+                            transaction_id=transaction.transaction_id,
+                            skipped=[d.name for d in self.detectors[index + 1:]],
+                        )
+                    break
             
             # Step 3: Aggregate Scores
-            composite_score = self._aggregate_scores(detector_results)
+            composite_score = self._aggregate_scores(weighted_sum, total_weight)
             
             # Step 4: Determine Severity and Alert Decision
             severity = self._get_severity(composite_score)
             should_alert = composite_score >= self.risk_threshold_alert
             
-            # Collect explanations
-            explanations = []
-            for result in detector_results.values():
-                explanations.extend(result.explanations)
-            
-            processing_time = (time.perf_counter() - start_time) * 1000
+            processing_time = (perf_counter() - start_time) * 1000
             
             # Track metrics
             metrics.track_detection_score(composite_score)
@@ -160,8 +216,8 @@ class DetectionEngine:
                 risk_score=round(composite_score, 2),
                 severity=severity,
                 should_alert=should_alert,
-                detector_scores={name: r.score for name, r in detector_results.items()},
-                feature_values=features,
+                detector_scores=detector_scores,
+                feature_values=features._asdict(),
                 explanations=explanations,
                 processing_time_ms=round(processing_time, 2),
             )
@@ -184,32 +240,40 @@ class DetectionEngine:
             )
             raise
     
-    def _aggregate_scores(
-        self,
-        detector_results: Dict[str, DetectionResult],
-    ) -> float:
+    def _aggregate_scores(self, weighted_sum: float, total_weight: float) -> float:
         """
         Aggregate detector scores using weighted average.
         
-        Weights can be adjusted based on detector performance.
+        Takes the sums of score * effective weight and of effective weight
+        (detector weight adjusted by confidence) accumulated while the
+        detectors ran. Weights can be adjusted based on detector performance.
         """
-        total_weight = 0.0
-        weighted_sum = 0.0
-        
-        for detector_name, result in detector_results.items():
-            weight = self.detector_weights.get(detector_name, 0.0)
-            
-            # Adjust weight by confidence
-            effective_weight = weight * result.confidence
-            
-            weighted_sum += result.score * effective_weight
-            total_weight += effective_weight
-        
         if total_weight == 0:
             return 50.0  # Neutral score if no detectors contributed
         
         return weighted_sum / total_weight
     
+    def _decision_locked(
+        self,
+        weighted_sum: float,
+        total_weight: float,
+        remaining_weight: float,
+    ) -> bool:
+        """
+        Check whether the alert decision is fixed regardless of remaining detectors.
+        
+        The detectors still to run can add at most `remaining_weight` of
+        effective weight with scores in [0, 100], which bounds the final
+        composite from both sides.
+        """
+        if total_weight == 0:
+            return False
+        
+        lowest = weighted_sum / (total_weight + remaining_weight)
+        highest = (weighted_sum + 100.0 * remaining_weight) / (total_weight + remaining_weight)
+        
+        return lowest >= self.risk_threshold_alert or highest < self.risk_threshold_alert
+    
     def _get_severity(self, score: float) -> AlertSeverity:
         """Determine alert severity from risk score."""
         if score >= 90:
@@ -225,9 +289,15 @@ class DetectionEngine:
         self,
         transactions: List[TransactionInput],
     ) -> List[DetectionOutput]:
-        """Process multiple transactions."""
+        """
+        Process multiple transactions.
+        
+        Features for the whole batch are extracted in one vectorized pass.
+        """
+        features_batch = await self.feature_engineer.extract_features_batch(transactions)
+        
         results = []
-        for transaction in transactions:
-            result = await self.process_transaction(transaction)
+        for transaction, features in zip(transactions, features_batch):
+            result = await self.process_transaction(transaction, features)
             results.append(result)
         return results
@@ -1,5 +1,5 @@
 """Features Package"""
 
-from app.detection.features.feature_engineer import FeatureEngineer
+from app.detection.features.feature_engineer import FeatureEngineer, Features
 
-__all__ = ["FeatureEngineer"]
+__all__ = ["FeatureEngineer", "Features"]
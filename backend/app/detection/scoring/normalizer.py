@@ -4,9 +4,82 @@ Score Normalizer
 Utilities for normalizing and calibrating risk scores.
 """
 
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 import math
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; kernels run as plain Python
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for `numba.njit`."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Sigmoids use the identity 1 / (1 + exp(-x)) == 0.5 * (1 + tanh(x / 2)),
+# which needs no divide and cannot overflow for large |x|
+@njit(cache=True, fastmath=True)
+def _sigmoid_kernel(value: float, center: float, steepness: float) -> float:
+    return 50.0 * (1.0 + math.tanh((value - center) * (steepness * 0.5)))
+
+
+@njit(cache=True, fastmath=True)
+def _zscore_kernel(value: float, mean: float, std: float, max_zscore: float) -> float:
+    if std == 0:
+        return 50.0
+    zscore = (value - mean) / std
+    zscore = max(-max_zscore, min(max_zscore, zscore))
+    return (zscore / max_zscore + 1.0) * 50.0
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _sigmoid_kernel_arr(values, center, steepness):
+    out = np.empty_like(values)
+    for i in prange(values.shape[0]):
+        out[i] = 50.0 * (1.0 + math.tanh((values[i] - center) * (steepness * 0.5)))
+    return out
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _zscore_kernel_arr(values, mean, std, max_zscore):
+    out = np.empty_like(values)
+    for i in prange(values.shape[0]):
+        zscore = (values[i] - mean) / std
+        zscore = max(-max_zscore, min(max_zscore, zscore))
+        out[i] = (zscore / max_zscore + 1.0) * 50.0
+    return out
+
+
+def _sumprod_fallback(p: Sequence[float], q: Sequence[float]) -> float:
+    # strict zip raises ValueError on a length mismatch, like math.sumprod
+    return math.fsum(x * y for x, y in zip(p, q, strict=True))
+
+
+# math.sumprod is Python 3.12+; older interpreters use the fsum-based fallback
+_sumprod = getattr(math, "sumprod", None) or _sumprod_fallback
+
+
+def warmup_kernels() -> None:
+    """
+    Compile the numba kernels ahead of the first request.
+    
+    No-op when numba is not installed.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    sample = np.zeros(1)
+    _sigmoid_kernel(0.0, 0.5, 10.0)
+    _zscore_kernel(0.0, 0.0, 1.0, 3.0)
+    _sigmoid_kernel_arr(sample, 0.5, 10.0)
+    _zscore_kernel_arr(sample, 0.0, 1.0, 3.0)
+
 
 class ScoreNormalizer:
     """
@@ -37,7 +110,60 @@ class ScoreNormalizer:
         normalized = (value - min_val) / (max_val - min_val)
         scaled = normalized * (target_max - target_min) + target_min
         
-        return max(target_min, min(target_max, scaled))
+        return target_min if scaled < target_min else (target_max if scaled > target_max else scaled)
+    
+    @staticmethod
+    def linear_normalize_batch(
+        values: np.ndarray,
+        min_val: float,
+        max_val: float,
+        target_min: float = 0,
+        target_max: float = 100,
+    ) -> np.ndarray:
+        """Vectorized `linear_normalize` over an array of values."""
+        values = np.asarray(values, dtype=np.float64)
+        if max_val == min_val:
+            return np.full(values.shape, (target_min + target_max) / 2)
+        
+        out = (values - min_val) * ((target_max - target_min) / (max_val - min_val))
+        out += target_min
+        return np.clip(out, target_min, target_max, out=out)
+    
+    @staticmethod
+    def make_linear_normalizer(
+        min_val: float,
+        max_val: float,
+        target_min: float = 0,
+        target_max: float = 100,
+        vectorized: bool = False,
+    ) -> Union[Callable[[float], float], Callable[[np.ndarray], np.ndarray]]:
+        """
+        Build a `linear_normalize` specialized for a fixed input range.
+        
+        Scale and offset are computed once, so each call is a multiply-add
+        and a clamp. With `vectorized=True` the returned function maps
+        arrays instead of scalars.
+        """
+        if max_val == min_val:
+            midpoint = (target_min + target_max) / 2
+            if vectorized:
+                return lambda values: np.full(np.shape(values), midpoint)
+            return lambda value: midpoint
+        
+        scale = (target_max - target_min) / (max_val - min_val)
+        offset = target_min - min_val * scale
+        
+        if vectorized:
+            def normalize_batch(values: np.ndarray) -> np.ndarray:
+                out = np.multiply(values, scale, dtype=np.float64)
+                out += offset
+                return np.clip(out, target_min, target_max, out=out)
+            return normalize_batch
+        
+        def normalize(value: float) -> float:
+            scaled = value * scale + offset
+            return target_min if scaled < target_min else (target_max if scaled > target_max else scaled)
+        return normalize
     
     @staticmethod
     def sigmoid_normalize(
@@ -51,14 +177,24 @@ class ScoreNormalizer:
         Creates an S-curve transformation.
         Useful for making extreme values more distinguishable.
         """
-        # Scale input to be centered at 0
-        x = (value - center) * steepness
-        
-        # Apply sigmoid
-        sigmoid = 1 / (1 + math.exp(-x))
+        return _sigmoid_kernel(value, center, steepness)
+    
+    @staticmethod
+    def sigmoid_normalize_batch(
+        values: np.ndarray,
+        center: float = 0.5,
+        steepness: float = 10,
+    ) -> np.ndarray:
+        """Vectorized `sigmoid_normalize` over an array of values."""
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if NUMBA_AVAILABLE and values.ndim == 1:
+            return _sigmoid_kernel_arr(values, center, steepness)
         
-        # Scale to 0-100
-        return sigmoid * 100
+        x = (values - center) * (steepness * 0.5)
+        np.tanh(x, out=x)
+        x += 1.0
+        x *= 50.0
+        return x
     
     @staticmethod
     def zscore_normalize(
@@ -72,41 +208,122 @@ class ScoreNormalizer:
         
         Normalizes based on standard deviations from mean.
         """
+        return _zscore_kernel(value, mean, std, max_zscore)
+    
+    @staticmethod
+    def zscore_normalize_batch(
+        values: np.ndarray,
+        mean: float,
+        std: float,
+        max_zscore: float = 3.0,
+    ) -> np.ndarray:
+        """Vectorized `zscore_normalize` over an array of values."""
+        values = np.ascontiguousarray(values, dtype=np.float64)
         if std == 0:
-            return 50.0
-        
-        zscore = (value - mean) / std
-        
-        # Clamp to max z-score range
-        zscore = max(-max_zscore, min(max_zscore, zscore))
-        
-        # Convert to 0-100 scale
-        normalized = ((zscore / max_zscore) + 1) / 2 * 100
+            return np.full(values.shape, 50.0)
+        if NUMBA_AVAILABLE and values.ndim == 1:
+            return _zscore_kernel_arr(values, mean, std, max_zscore)
         
-        return normalized
+        z = (values - mean) / std
+        np.clip(z, -max_zscore, max_zscore, out=z)
+        z /= max_zscore
+        z += 1.0
+        z *= 50.0
+        return z
+    
+    # Sorted copies of immutable reference sets (tuples and read-only arrays)
+    # keyed by id(). Each entry keeps the original object alive so its id
+    # cannot be reused while cached.
+    _sorted_cache: Dict[int, Tuple[Sequence[float], np.ndarray]] = {}
+    _SORTED_CACHE_SIZE = 32
     
     @staticmethod
+    def _is_immutable(reference_values: Sequence[float]) -> bool:
+        """Whether a reference set cannot change after it is cached."""
+        if isinstance(reference_values, tuple):
+            return True
+        return isinstance(reference_values, np.ndarray) and not reference_values.flags.writeable
+    
+    @classmethod
+    def _sorted_reference(cls, reference_values: Sequence[float]) -> np.ndarray:
+        """Return the sorted array for an immutable reference set, sorting it once."""
+        key = id(reference_values)
+        entry = cls._sorted_cache.get(key)
+        if entry is not None and entry[0] is reference_values:
+            return entry[1]
+        
+        sorted_values = np.sort(np.asarray(reference_values, dtype=np.float64))
+        if len(cls._sorted_cache) >= cls._SORTED_CACHE_SIZE:
+            cls._sorted_cache.pop(next(iter(cls._sorted_cache)))
+        cls._sorted_cache[key] = (reference_values, sorted_values)
+        return sorted_values
+    
+    @classmethod
     def percentile_normalize(
+        cls,
         value: float,
-        reference_values: List[float],
+        reference_values: Sequence[float],
     ) -> float:
         """
         Percentile-based normalization.
         
-        Returns the percentile rank of the value.
+        Returns the mid-rank percentile 100 * (count_below + count_equal / 2) / n,
+        which is the Hazen rank 100 * (i - 0.5) / n for a value in a reference
+        set without ties, and stays within [0, 100] otherwise.
+        
+        Tuples and read-only arrays are sorted once and cached; other
+        sequences are scanned on every call.
         """
-        if not reference_values:
+        n = len(reference_values)
+        if n == 0:
             return 50.0
         
-        count_below = sum(1 for v in reference_values if v < value)
-        percentile = (count_below / len(reference_values)) * 100
+        if cls._is_immutable(reference_values):
+            sorted_values = cls._sorted_reference(reference_values)
+            count_below = int(np.searchsorted(sorted_values, value, side="left"))
+            count_not_above = int(np.searchsorted(sorted_values, value, side="right"))
+        else:
+            count_below = 0
+            count_not_above = 0
+            for v in reference_values:
+                if v < value:
+                    count_below += 1
+                    count_not_above += 1
+                elif v == value:
+                    count_not_above += 1
+        
+        return 50.0 * (count_below + count_not_above) / n
+    
+    @classmethod
+    def percentile_normalize_batch(
+        cls,
+        values: np.ndarray,
+        reference_values: Sequence[float],
+    ) -> np.ndarray:
+        """Vectorized `percentile_normalize` over an array of values."""
+        values = np.asarray(values, dtype=np.float64)
+        if len(reference_values) == 0:
+            return np.full(values.shape, 50.0)
         
-        return percentile
+        if cls._is_immutable(reference_values):
+            sorted_values = cls._sorted_reference(reference_values)
+        else:
+            sorted_values = np.sort(np.asarray(reference_values, dtype=np.float64))
+        ranks = np.searchsorted(sorted_values, values, side="left").astype(np.float64)
+        ranks += np.searchsorted(sorted_values, values, side="right")
+        ranks *= 50.0 / len(sorted_values)
+        return ranks
     
     @staticmethod
     def clamp(value: float, min_val: float = 0, max_val: float = 100) -> float:
-        """Clamp value to range."""
-        return max(min_val, min(max_val, value))
+        """
+        Clamp value to range.
+        
+        .. deprecated::
+            Kept for API compatibility. Inline the two comparisons at hot
+            call sites, or use `np.clip` on arrays.
+        """
+        return min_val if value < min_val else (max_val if value > max_val else value)
     
     @staticmethod
     def decay_old_score(
@@ -140,21 +357,21 @@ class ScoreNormalizer:
             return 0.0
         
         if method == "mean":
-            return sum(scores) / len(scores)
+            return math.fsum(scores) / len(scores)
         
         elif method == "weighted":
             if weights is None:
                 weights = [1.0] * len(scores)
-            total_weight = sum(weights)
+            total_weight = math.fsum(weights)
             if total_weight == 0:
                 return 0.0
-            return sum(s * w for s, w in zip(scores, weights)) / total_weight
+            return _sumprod(scores, weights) / total_weight
         
         elif method == "max":
             return max(scores)
         
         elif method == "rms":
-            mean_square = sum(s ** 2 for s in scores) / len(scores)
+            mean_square = _sumprod(scores, scores) / len(scores)
             return math.sqrt(mean_square)
         
         else:
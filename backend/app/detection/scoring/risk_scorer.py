@@ -4,20 +4,46 @@ Risk Scorer
 Combines detector outputs into a unified risk score.
 """
 
-from typing import Dict, List
+from typing import Dict, Final, List, Mapping, Optional, Tuple, Union
 from dataclasses import dataclass
+import bisect
+import logging
+from types import MappingProxyType
 
-from app.core.logging import get_logger
+import numpy as np
+
+from app.core.logging import get_logger, is_log_enabled
+from app.models.enums import Detector
 
 logger = get_logger(__name__)
 
+# Risk level buckets: scores in [_THRESHOLDS[i-1], _THRESHOLDS[i]) map to _LEVELS[i]
+_THRESHOLDS_LIST: Final = (30.0, 50.0, 70.0, 90.0)
+_THRESHOLDS: Final = np.array(_THRESHOLDS_LIST)
+_LEVELS: Final = ("MINIMAL", "LOW", "MEDIUM", "HIGH", "CRITICAL")
+_LEVELS_ARR: Final = np.array(_LEVELS)
+
+# Detector names as reported by the detectors, in `Detector` index order
+DETECTOR_NAMES: Final = tuple(d.name.lower() for d in Detector)
+_DETECTOR_NAME_SET: Final = frozenset(DETECTOR_NAMES)
+
+
+@dataclass(slots=True, frozen=True)
+class BreakdownEntry:
+    """One detector's contribution to a composite score."""
+    detector: str
+    raw_score: float
+    weight: float
+    confidence: float
+    contribution: float
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScoringResult:
     """Result of risk scoring."""
     composite_score: float
-    component_scores: Dict[str, float]
-    score_breakdown: Dict[str, float]
+    component_scores: Tuple[Tuple[str, float], ...]
+    score_breakdown: Tuple[BreakdownEntry, ...]
     confidence: float
 
 
@@ -29,32 +55,83 @@ class RiskScorer:
     interpretable risk score.
     """
     
-    # Default weights for score components
-    DEFAULT_WEIGHTS = {
+    # Default weights for score components (read-only; they already sum to
+    # 1.0, so default scorers share them without validation or copying)
+    DEFAULT_WEIGHTS: Final[Mapping[str, float]] = MappingProxyType({
         "statistical": 0.25,
         "behavioral": 0.35,
         "ml": 0.40,
-    }
+    })
+    
+    # The same defaults indexed by `Detector`
+    DEFAULT_WEIGHTS_VEC: Final = np.array([0.25, 0.35, 0.40])
+    DEFAULT_WEIGHTS_VEC.flags.writeable = False
+    
+    def __init__(self, weights: Union[np.ndarray, Mapping[str, float], None] = None):
+        """
+        Args:
+            weights: Weight vector indexed by `Detector`. A name-keyed dict
+                is also accepted and converted once (see `from_dict`); keys
+                outside `Detector` weight custom detectors' dict scores. None
+                or an empty dict selects DEFAULT_WEIGHTS.
+        """
+        self._extra_weights: Mapping[str, float] = {}
+        if weights is None or (isinstance(weights, Mapping) and not weights):
+            self._weights_vec = self.DEFAULT_WEIGHTS_VEC
+            self.weights = self.DEFAULT_WEIGHTS
+            return
+        
+        if isinstance(weights, Mapping):
+            weights_vec = self._vector_from_dict(weights)
+            extra_weights = {
+                name: float(w) for name, w in weights.items() if name not in _DETECTOR_NAME_SET
+            }
+        else:
+            weights_vec = np.array(weights, dtype=np.float64)
+            if weights_vec.shape != (len(Detector),):
+                raise ValueError(
+                    f"Expected {len(Detector)} detector weights, got shape {weights_vec.shape}"
+                )
+            extra_weights = {}
+        
+        self._weights_vec, self._extra_weights = self._validate_weights(weights_vec, extra_weights)
+        self.weights = dict(zip(DETECTOR_NAMES, self._weights_vec.tolist()))
+        self.weights.update(self._extra_weights)
+    
+    @classmethod
+    def from_dict(cls, weights: Mapping[str, float]) -> "RiskScorer":
+        """Create a scorer from legacy name-keyed weights (empty means defaults)."""
+        return cls(weights or None)
     
-    def __init__(self, weights: Dict[str, float] = None):
-        self.weights = weights or self.DEFAULT_WEIGHTS
-        self._validate_weights()
+    @staticmethod
+    def _vector_from_dict(weights: Mapping[str, float]) -> np.ndarray:
+        """Pick the `Detector` weights out of name-keyed weights, as a vector."""
+        return np.array([weights.get(name, 0.0) for name in DETECTOR_NAMES])
     
-    def _validate_weights(self) -> None:
+    @staticmethod
+    def _validate_weights(
+        weights_vec: np.ndarray,
+        extra_weights: Dict[str, float],
+    ) -> Tuple[np.ndarray, Dict[str, float]]:
         """Ensure weights sum to 1.0 (or close)."""
-        total = sum(self.weights.values())
+        total = float(weights_vec.sum()) + sum(extra_weights.values())
+        if total <= 0:
+            raise ValueError(f"Detector weights must have a positive sum, got {total}")
         if abs(total - 1.0) > 0.01:
             logger.warning(
                 "Weights do not sum to 1.0, normalizing",
                 total=total,
             )
             # Normalize weights
-            self.weights = {k: v / total for k, v in self.weights.items()}
+            weights_vec = weights_vec / total
+            extra_weights = {name: w / total for name, w in extra_weights.items()}
+        return weights_vec, extra_weights
     
     def calculate_composite_score(
         self,
-        detector_scores: Dict[str, float],
-        confidences: Dict[str, float] = None,
+        detector_scores: Union[Dict[str, float], np.ndarray],
+        confidences: Union[Dict[str, float], np.ndarray, None] = None,
+        include_breakdown: bool = False,
     ) -> ScoringResult:
         """
         Calculate composite risk score from detector outputs.
@@ -62,30 +139,62 @@ class RiskScorer:
         Uses confidence-weighted averaging:
         - Higher confidence scores contribute more
         - Missing detectors don't affect the score adversely
+        
+        Scores and confidences are either name-keyed dicts or arrays indexed
+        by `Detector`, with NaN marking a detector that produced no score.
+        Dict scores for detectors outside `Detector` count with the weight
+        given for them at construction (0 if none) and are reported in
+        `component_scores` after the built-in detectors. The per-detector
+        `score_breakdown` entries are only built when `include_breakdown` is
+        set; otherwise it is empty.
         """
-        confidences = confidences or {k: 1.0 for k in detector_scores}
-        
-        weighted_sum = 0.0
-        total_weight = 0.0
-        score_breakdown = {}
-        
-        for detector, score in detector_scores.items():
-            weight = self.weights.get(detector, 0.0)
-            confidence = confidences.get(detector, 1.0)
-            
-            # Effective weight considers both assigned weight and confidence
-            effective_weight = weight * confidence
-            
-            contribution = score * effective_weight
-            weighted_sum += contribution
+        extra_scores: Tuple[Tuple[str, float], ...] = ()
+        if isinstance(detector_scores, np.ndarray):
+            score_vec = np.asarray(detector_scores, dtype=np.float64)
+        else:
+            if not _DETECTOR_NAME_SET.issuperset(detector_scores):
+                extra_scores = tuple(
+                    (d, float(v)) for d, v in detector_scores.items()
+                    if d not in _DETECTOR_NAME_SET
+                )
+            score_vec = np.fromiter(
+                (detector_scores.get(d, np.nan) for d in DETECTOR_NAMES),
+                dtype=np.float64,
+                count=len(DETECTOR_NAMES),
+            )
+        
+        conf_map: Mapping[str, float]
+        if confidences is None:
+            conf_map = {}
+            conf_vec = np.ones(len(Detector))
+        elif isinstance(confidences, np.ndarray):
+            conf_map = {}
+            conf_vec = np.asarray(confidences, dtype=np.float64)
+        else:
+            conf_map = confidences
+            conf_vec = np.fromiter(
+                (confidences.get(d, 1.0) for d in DETECTOR_NAMES),
+                dtype=np.float64,
+                count=len(DETECTOR_NAMES),
+            )
+        
+        # Detectors without a score (NaN) contribute no weight
+        scored = ~np.isnan(score_vec)
+        score_vec = np.where(scored, score_vec, 0.0)
+        scored_weights = np.where(scored, self._weights_vec, 0.0)
+        
+        # Effective weight considers both assigned weight and confidence
+        effective = scored_weights * conf_vec
+        weighted_sum = float(np.dot(score_vec, effective))
+        total_weight = float(effective.sum())
+        scored_weight = float(scored_weights.sum())
+        
+        for detector, score in extra_scores:
+            weight = self._extra_weights.get(detector, 0.0)
+            effective_weight = weight * conf_map.get(detector, 1.0)
+            weighted_sum += score * effective_weight
             total_weight += effective_weight
-            
-            score_breakdown[detector] = {
-                "raw_score": score,
-                "weight": weight,
-                "confidence": confidence,
-                "contribution": contribution,
-            }
+            scored_weight += weight
         
         # Calculate composite score
         if total_weight > 0:
@@ -93,23 +202,49 @@ class RiskScorer:
         else:
             composite_score = 50.0  # Neutral if no data
         
-        # Overall confidence is the weighted average of confidences
-        overall_confidence = (
-            sum(c * self.weights.get(d, 0) for d, c in confidences.items())
-            / sum(self.weights.get(d, 0) for d in confidences)
-            if confidences else 1.0
-        )
+        # Overall confidence is the weighted average of confidences, which
+        # shares its numerator with the composite's total effective weight
+        overall_confidence = total_weight / scored_weight if scored_weight else 1.0
         
-        logger.debug(
-            "Composite score calculated",
-            composite_score=composite_score,
-            confidence=overall_confidence,
-        )
+        scored_indices = np.flatnonzero(scored).tolist()
+        
+        score_breakdown: List[BreakdownEntry] = []
+        if include_breakdown:
+            for i in scored_indices:
+                score = float(score_vec[i])
+                weight = float(self._weights_vec[i])
+                confidence = float(conf_vec[i])
+                score_breakdown.append(BreakdownEntry(
+                    detector=DETECTOR_NAMES[i],
+                    raw_score=score,
+                    weight=weight,
+                    confidence=confidence,
+                    contribution=score * weight * confidence,
+                ))
+            for detector, score in extra_scores:
+                weight = self._extra_weights.get(detector, 0.0)
+                confidence = float(conf_map.get(detector, 1.0))
+                score_breakdown.append(BreakdownEntry(
+                    detector=detector,
+                    raw_score=score,
+                    weight=weight,
+                    confidence=confidence,
+                    contribution=score * weight * confidence,
+                ))
+        
+        if is_log_enabled(logging.DEBUG):
+            logger.debug(
+                "Composite score calculated",
+                composite_score=composite_score,
+                confidence=overall_confidence,
+            )
         
         return ScoringResult(
             composite_score=round(composite_score, 2),
-            component_scores=detector_scores,
-            score_breakdown=score_breakdown,
+            component_scores=tuple(
+                (DETECTOR_NAMES[i], float(score_vec[i])) for i in scored_indices
+            ) + extra_scores,
+            score_breakdown=tuple(score_breakdown),
             confidence=round(overall_confidence, 2),
         )
     
@@ -141,17 +276,35 @@ class RiskScorer:
         if rules_context.get("high_risk_country"):
             adjusted_score = min(100, adjusted_score + 15)
         
-        return max(0.0, min(100.0, adjusted_score))
+        return 0.0 if adjusted_score < 0.0 else (100.0 if adjusted_score > 100.0 else adjusted_score)
+    
+    def apply_business_rules_batch(
+        self,
+        scores: np.ndarray,
+        is_vip: np.ndarray,
+        matches_pattern: np.ndarray,
+        verified_merchant: np.ndarray,
+        high_risk_country: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Vectorized `apply_business_rules` over arrays of scores and rule flags.
+        
+        Each flag array is a boolean mask aligned with `scores`. Rules apply
+        in the same order as the scalar method.
+        """
+        out = np.array(scores, dtype=np.float64)
+        
+        out[np.asarray(is_vip, dtype=bool)] *= 0.9
+        np.maximum(out, 80.0, out=out, where=np.asarray(matches_pattern, dtype=bool))
+        out[np.asarray(verified_merchant, dtype=bool)] *= 0.85
+        np.add(out, 15.0, out=out, where=np.asarray(high_risk_country, dtype=bool))
+        
+        return np.clip(out, 0.0, 100.0, out=out)
     
     def get_risk_level(self, score: float) -> str:
         """Convert numeric score to risk level."""
-        if score >= 90:
-            return "CRITICAL"
-        elif score >= 70:
-            return "HIGH"
-        elif score >= 50:
-            return "MEDIUM"
-        elif score >= 30:
-            return "LOW"
-        else:
-            return "MINIMAL"
+        return _LEVELS[bisect.bisect_right(_THRESHOLDS_LIST, score)]
+    
+    def get_risk_levels(self, scores: np.ndarray) -> np.ndarray:
+        """Vectorized `get_risk_level` over an array of scores."""
+        return np.take(_LEVELS_ARR, np.digitize(scores, _THRESHOLDS))
@@ -7,16 +7,20 @@ Main application factory with middleware, routes, and lifecycle management.
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from app.config import settings
 from app.api.routes import alerts, analytics, dashboard, feedback, investigations
 from app.api.middleware import RequestLoggingMiddleware, ObservabilityMiddleware
 from app.core.errors import AppException, register_exception_handlers
 from app.core.logging import setup_logging, get_logger
+from app.core.responses import ORJSONResponse
 from app.db.session import init_db, close_db
+from app.detection.scoring.normalizer import warmup_kernels
+from app.models.schemas import prime_validators
+from app.services.investigation_service import drain_background_tasks, drain_note_buffer
 
 logger = get_logger(__name__)
 
@@ -29,11 +33,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting application", app_name=settings.APP_NAME, version=settings.APP_VERSION)
     await init_db()
     logger.info("Database initialized")
+    warmup_kernels()
+    prime_validators()
     
     yield
     
     # Shutdown
     logger.info("Shutting down application")
+    await drain_note_buffer()
+    await drain_background_tasks()
     await close_db()
     logger.info("Database connections closed")
 
@@ -49,6 +57,7 @@ def create_application() -> FastAPI:
         redoc_url="/redoc" if settings.DEBUG else None,
         openapi_url="/openapi.json" if settings.DEBUG else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
     # CORS Middleware
@@ -74,26 +83,35 @@ def create_application() -> FastAPI:
     app.include_router(analytics.router, prefix="/api/analytics", tags=["Analytics"])
     app.include_router(feedback.router, prefix="/api/feedback", tags=["Feedback"])
     
+    # Health and root payloads are fixed once settings are loaded, so they
+    # are serialized a single time here instead of on every probe
+    health_body = orjson.dumps({
+        "status": "healthy",
+        "app": settings.APP_NAME,
+        "version": settings.APP_VERSION,
+        "environment": settings.ENVIRONMENT,
+    })
+    root_body = orjson.dumps({
+        "message": "Market Anomaly & Fraud Detection API",
+        "version": settings.APP_VERSION,
+        "docs": "/docs" if settings.DEBUG else "Disabled in production",
+    })
+    
     # Health Check
     @app.get("/health", tags=["Health"])
-    async def health_check():
+    async def health_check() -> Response:
         """Health check endpoint for load balancers and monitoring."""
-        return {
-            "status": "healthy",
-            "app": settings.APP_NAME,
-            "version": settings.APP_VERSION,
-            "environment": settings.ENVIRONMENT,
-        }
+        return Response(
+            content=health_body,
+            media_type="application/json",
+            headers={"Cache-Control": "no-cache"},
+        )
     
     # Root endpoint
     @app.get("/", tags=["Root"])
-    async def root():
+    async def root() -> Response:
         """API root endpoint."""
-        return {
-            "message": "Market Anomaly & Fraud Detection API",
-            "version": settings.APP_VERSION,
-            "docs": "/docs" if settings.DEBUG else "Disabled in production",
-        }
+        return Response(content=root_body, media_type="application/json")
     
     return app
 
@@ -111,4 +129,5 @@ if __name__ == "__main__":
         port=settings.PORT,
         reload=settings.DEBUG,
         workers=settings.WORKERS,
+        loop="uvloop",
     )
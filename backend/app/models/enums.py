@@ -4,7 +4,7 @@ Enumerations
 Centralized enum definitions for the application.
 """
 
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class AlertSeverity(str, Enum):
@@ -96,3 +96,10 @@ class MetricPeriod(str, Enum):
     DAILY = "DAILY"
     WEEKLY = "WEEKLY"
     MONTHLY = "MONTHLY"
+
+
+class Detector(IntEnum):
+    """Detector positions in score and weight vectors."""
+    STATISTICAL = 0
+    BEHAVIORAL = 1
+    ML = 2
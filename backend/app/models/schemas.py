@@ -4,9 +4,11 @@ Pydantic Schemas
 API request/response schemas that define the contract between frontend and backend.
 """
 
+from collections import Counter
 from datetime import datetime
-from typing import Optional, List, Any
-from pydantic import BaseModel, Field, ConfigDict
+from enum import Enum
+from typing import Optional, List, Any, Dict, FrozenSet
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 
 from app.models.enums import (
     AlertSeverity,
@@ -32,11 +34,19 @@ class BaseSchema(BaseModel):
 
 class PaginationInfo(BaseSchema):
     """Pagination metadata."""
-    page: int = Field(..., ge=1)
-    total_pages: int = Field(..., ge=0)
-    total_records: int = Field(..., ge=0)
+    page: int = Field(..., ge=1, description="Deprecated: use next_cursor")
+    total_pages: Optional[int] = Field(
+        default=None, ge=0, description="Deprecated: use next_cursor; null on cursor pages",
+    )
+    total_records: Optional[int] = Field(
+        default=None, ge=0, description="Null on cursor pages, which are not counted",
+    )
     has_next: bool = False
     has_previous: bool = False
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the page after this one; null on the last page",
+    )
 
 
 class ErrorResponse(BaseSchema):
@@ -76,13 +86,49 @@ class AlertDetail(BaseSchema):
     historical_scores: List[float] = []
 
 
+def _as_filter_set(value: Any) -> Any:
+    """Accept one filter value or several; an empty selection means no filter."""
+    if value is None or isinstance(value, (str, Enum)):
+        return None if value is None else (value,)
+    return value or None
+
+
 class AlertFilters(BaseSchema):
-    """Alert filtering parameters."""
+    """Alert filtering parameters (multi-valued filters match any selected value)."""
     page: int = Field(default=1, ge=1)
     limit: int = Field(default=10, ge=1, le=100)
-    severity: Optional[AlertSeverity] = None
-    status: Optional[AlertStatus] = None
+    severity: Optional[FrozenSet[AlertSeverity]] = None
+    status: Optional[FrozenSet[AlertStatus]] = None
     search: Optional[str] = None
+    cursor: Optional[str] = None
+    
+    _coerce_sets = field_validator("severity", "status", mode="before")(_as_filter_set)
+
+
+class AlertStatusChange(BaseSchema):
+    """One alert's requested status change."""
+    alert_id: str
+    status: AlertStatus
+
+
+class BulkStatusUpdateRequest(BaseSchema):
+    """Request to change the status of several alerts (each alert at most once)."""
+    updates: List[AlertStatusChange] = Field(..., min_length=1, max_length=500)
+    
+    @field_validator("updates")
+    @classmethod
+    def _unique_alert_ids(cls, updates: List[AlertStatusChange]) -> List[AlertStatusChange]:
+        counts = Counter(update.alert_id for update in updates)
+        duplicates = sorted(alert_id for alert_id, n in counts.items() if n > 1)
+        if duplicates:
+            raise ValueError(f"Duplicate alert_id in updates: {', '.join(duplicates)}")
+        return updates
+
+
+class BulkStatusUpdateResult(BaseSchema):
+    """Outcome of a bulk status update."""
+    updated: List[str]
+    rejected: Dict[str, str] = Field(default_factory=dict, description="alert_id -> reason")
 
 
 class AlertsResult(BaseSchema):
@@ -121,6 +167,8 @@ class Transaction(BaseSchema):
 
 class FeatureDeviation(BaseSchema):
     """Feature deviation from normal behavior."""
+    model_config = ConfigDict(frozen=True)
+    
     feature: str
     deviation: str
     risk_level: RiskLevel
@@ -156,6 +204,8 @@ class AlertsTrend(BaseSchema):
 
 class SeverityDistribution(BaseSchema):
     """Severity distribution for donut chart."""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     value: int
     color: str
@@ -297,12 +347,15 @@ class Feedback(BaseSchema):
 
 
 class FeedbackFilters(BaseSchema):
-    """Feedback filtering parameters."""
+    """Feedback filtering parameters (decision matches any selected value)."""
     page: int = Field(default=1, ge=1)
     limit: int = Field(default=20, ge=1, le=100)
-    decision: Optional[FeedbackDecision] = None
+    decision: Optional[FrozenSet[FeedbackDecision]] = None
     analyst: Optional[str] = None
     range: str = "30d"
+    cursor: Optional[str] = None
+    
+    _coerce_sets = field_validator("decision", mode="before")(_as_filter_set)
 
 
 class FeedbackSummary(BaseSchema):
@@ -331,6 +384,34 @@ class FeedbackListResponse(BaseSchema):
 # Forward References Update
 # =============================================================================
 
-AlertDetail.model_rebuild()
-Investigation.model_rebuild()
-DashboardMetrics.model_rebuild()
+# Build every schema's core validator at import rather than on first use
+for _schema in BaseSchema.__subclasses__():
+    _schema.model_rebuild(force=True, _types_namespace=globals())
+del _schema
+
+
+# Representative payloads used to warm the validators of nested schemas
+_PRIME_PAYLOADS = (
+    (
+        AlertDetail,
+        b'{"alert_id": "ALT-PRIME", "timestamp": "2024-01-01T00:00:00", '
+        b'"entity": "ACC-0", "entity_type": "ACCOUNT", "risk_score": 0.0, '
+        b'"severity": "LOW", "status": "ACTIVE", '
+        b'"transaction": {"transaction_id": "TXN-0", "amount": 0.0, '
+        b'"timestamp": "2024-01-01T00:00:00", "source_account": "ACC-0", '
+        b'"destination_account": "ACC-1"}, '
+        b'"feature_deviations": [{"feature": "amount", "deviation": "0%", "risk_level": "LOW"}]}',
+    ),
+    (
+        Investigation,
+        b'{"alert_id": "ALT-PRIME", "entity": "ACC-0", "status": "ACTIVE", '
+        b'"risk_score": 0.0, "notes": [{"note_id": "NOTE-0", "content": "-", '
+        b'"analyst_id": "system", "timestamp": "2024-01-01T00:00:00"}]}',
+    ),
+)
+
+
+def prime_validators() -> None:
+    """Run sample payloads through the nested detail schemas once at startup."""
+    for schema, payload in _PRIME_PAYLOADS:
+        schema.model_validate(schema.model_validate_json(payload).model_dump())
@@ -4,16 +4,23 @@ Alert Service
 Business logic for alert management, filtering, and status transitions.
 """
 
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+import logging
+import os
 import random
-import uuid
+
+from sqlalchemy.engine import Row
 
 from app.models.schemas import (
     Alert,
     AlertDetail,
     AlertFilters,
     AlertsResult,
+    BulkStatusUpdateResult,
     PaginationInfo,
     Transaction,
     FeatureDeviation,
@@ -21,22 +28,71 @@ from app.models.schemas import (
 from app.models.enums import AlertSeverity, AlertStatus, EntityType, RiskLevel
 from app.db.repositories.alert_repository import AlertRepository
 from app.db.repositories.transaction_repository import TransactionRepository
-from app.core.errors import NotFoundError, BusinessRuleViolation
-from app.core.logging import get_logger
+from app.core.errors import NotFoundError, BusinessRuleViolation, ValidationError
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.logging import get_logger, is_log_enabled
 
 logger = get_logger(__name__)
 
+# Severity bands: a score at or above _SEV_THRESHOLDS[i] maps to _SEV_LEVELS[i + 1]
+_SEV_THRESHOLDS = (50.0, 70.0, 90.0)
+_SEV_LEVELS = (AlertSeverity.LOW, AlertSeverity.MEDIUM, AlertSeverity.HIGH, AlertSeverity.CRITICAL)
+
+# Mock alert-detail deviations, built once and shared by every request
+_FEATURE_DEVIATIONS: Tuple[FeatureDeviation, ...] = (
+    FeatureDeviation(
+        feature="Transaction Amount",
+        deviation="+340%",
+        risk_level=RiskLevel.VERY_HIGH,
+    ),
+    FeatureDeviation(
+        feature="Time of Day",
+        deviation="Unusual Pattern",
+        risk_level=RiskLevel.HIGH,
+    ),
+    FeatureDeviation(
+        feature="Frequency",
+        deviation="+8x Normal Rate",
+        risk_level=RiskLevel.HIGH,
+    ),
+    FeatureDeviation(
+        feature="Geographic Location",
+        deviation="New Country",
+        risk_level=RiskLevel.MEDIUM,
+    ),
+)
+
+# Mock list order (newest first, alert_id breaks ties); also the keyset cursor key
+_ALERT_SORT_KEY = attrgetter("timestamp", "alert_id")
+
+# Mock timestamps are offsets from process start, so the snapshot is the
+# same on every build and keyset cursors stay valid for the process lifetime
+_MOCK_EPOCH = datetime.now()
+
+
+class _MockAlertIndex(NamedTuple):
+    """Mock alerts sorted newest first, plus per-severity/status buckets."""
+    
+    sorted_by_ts: Tuple[Alert, ...]
+    by_severity: Dict[AlertSeverity, Tuple[Alert, ...]]
+    by_status: Dict[AlertStatus, Tuple[Alert, ...]]
+    search_keys: Dict[str, Tuple[str, str]]  # alert_id -> (alert_id, entity) lowercased
+
 
 class AlertService:
     """Service for alert-related business logic."""
     
     # Valid status transitions
-    VALID_TRANSITIONS = {
-        AlertStatus.ACTIVE: [AlertStatus.INVESTIGATING, AlertStatus.RESOLVED],
-        AlertStatus.INVESTIGATING: [AlertStatus.RESOLVED, AlertStatus.FALSE_POSITIVE, AlertStatus.ACTIVE],
-        AlertStatus.RESOLVED: [AlertStatus.ACTIVE],
-        AlertStatus.FALSE_POSITIVE: [AlertStatus.ACTIVE],
+    VALID_TRANSITIONS: Dict[AlertStatus, FrozenSet[AlertStatus]] = {
+        AlertStatus.ACTIVE: frozenset({AlertStatus.INVESTIGATING, AlertStatus.RESOLVED}),
+        AlertStatus.INVESTIGATING: frozenset({AlertStatus.RESOLVED, AlertStatus.FALSE_POSITIVE, AlertStatus.ACTIVE}),
+        AlertStatus.RESOLVED: frozenset({AlertStatus.ACTIVE}),
+        AlertStatus.FALSE_POSITIVE: frozenset({AlertStatus.ACTIVE}),
     }
+    NO_TRANSITIONS: FrozenSet[AlertStatus] = frozenset()
+    
+    # Alerts per lookup/UPDATE round-trip in bulk_update_status
+    BULK_CHUNK_SIZE = 50
     
     def __init__(
         self,
@@ -55,46 +111,89 @@ class AlertService:
         - ACTIVE and INVESTIGATING alerts prioritized
         - Search matches alert_id and entity
         """
-        logger.info("Fetching alerts", filters=filters.model_dump())
+        if is_log_enabled(logging.INFO):
+            logger.info("Fetching alerts", filters=filters.model_dump())
         
-        # For MVP, generate mock data
-        all_alerts = self._generate_mock_alerts()
+        # Keyset cursor (detection_time, id) of the last alert already seen
+        after = decode_cursor(filters.cursor) if filters.cursor else None
+        next_cursor = None
         
-        # Apply filters
-        filtered = all_alerts
-        
-        if filters.severity:
-            filtered = [a for a in filtered if a.severity == filters.severity]
-        
-        if filters.status:
-            filtered = [a for a in filtered if a.status == filters.status]
-        
-        if filters.search:
-            search_lower = filters.search.lower()
+        if self.alert_repo.session is not None:
+            # Filtering, ordering and paging happen in the database
+            if after is None:
+                rows, total = await self.alert_repo.list(filters)
+                has_next = filters.page * filters.limit < total
+            else:
+                rows = await self.alert_repo.list_after(filters, after)
+                has_next = len(rows) > filters.limit
+                rows = rows[:filters.limit]
+            page_alerts = [self._to_alert(row) for row in rows]
+            if has_next and rows:
+                next_cursor = encode_cursor(rows[-1].detection_time, rows[-1].id)
+        else:
+            # For MVP, serve the cached mock snapshot
+            index = self._mock_alert_index()
+            
+            want_severity = filters.severity
+            want_status = filters.status
+            search_lower = filters.search.lower() if filters.search else None
+            
+            # Scan only the smallest pre-sorted bucket that can match; a
+            # bucket covers a filter only when a single value is selected
+            source = index.sorted_by_ts
+            if want_severity and len(want_severity) == 1:
+                (severity,) = want_severity
+                source = index.by_severity.get(severity, ())
+            if want_status and len(want_status) == 1:
+                (status,) = want_status
+                by_status = index.by_status.get(status, ())
+                if len(by_status) < len(source):
+                    source = by_status
+            
+            # Apply all filters in one pass
+            search_keys = index.search_keys
             filtered = [
-                a for a in filtered
-                if search_lower in a.alert_id.lower() or search_lower in a.entity.lower()
+                a for a in source
+                if (want_severity is None or a.severity in want_severity)
+                and (want_status is None or a.status in want_status)
+                and (
+                    search_lower is None
+                    or search_lower in search_keys[a.alert_id][0]
+                    or search_lower in search_keys[a.alert_id][1]
+                )
             ]
+            
+            # Paginate
+            total = len(filtered)
+            if after is None:
+                start = (filters.page - 1) * filters.limit
+            else:
+                start = next(
+                    (i for i, a in enumerate(filtered) if _ALERT_SORT_KEY(a) < after),
+                    total,
+                )
+            end = start + filters.limit
+            page_alerts = filtered[start:end]
+            has_next = end < total
+            if has_next and page_alerts:
+                next_cursor = encode_cursor(page_alerts[-1].timestamp, page_alerts[-1].alert_id)
         
-        # Sort by timestamp descending
-        filtered.sort(key=lambda x: x.timestamp, reverse=True)
-        
-        # Paginate
-        total = len(filtered)
-        start = (filters.page - 1) * filters.limit
-        end = start + filters.limit
-        page_alerts = filtered[start:end]
-        
-        total_pages = (total + filters.limit - 1) // filters.limit
+        # Cursor pages are not counted: the total would cost a full scan per page
+        total_records: Optional[int] = None
+        total_pages: Optional[int] = None
+        if after is None:
+            total_records = total
+            total_pages = (total + filters.limit - 1) // filters.limit
         
         return AlertsResult(
             alerts=page_alerts,
             pagination=PaginationInfo(
                 page=filters.page,
                 total_pages=total_pages,
-                total_records=total,
-                has_next=filters.page < total_pages,
-                has_previous=filters.page > 1,
+                total_records=total_records,
+                has_next=has_next,
+                has_previous=after is not None or filters.page > 1,
+                next_cursor=next_cursor,
             ),
         )
     
@@ -110,9 +209,10 @@ class AlertService:
         if not alert_id.startswith("ALT-"):
             raise NotFoundError(f"Alert {alert_id} not found")
         
+        now = datetime.now()
         return AlertDetail(
             alert_id=alert_id,
-            timestamp=datetime.now() - timedelta(minutes=random.randint(5, 120)),
+            timestamp=now - timedelta(minutes=random.randint(5, 120)),
             entity=f"User #{random.randint(10000, 99999)}",
             entity_type=EntityType.USER,
             risk_score=random.uniform(60, 98),
@@ -120,37 +220,16 @@ class AlertService:
             status=AlertStatus.ACTIVE,
             description="Unusual transaction pattern detected",
             transaction=Transaction(
-                transaction_id=f"TXN-{uuid.uuid4().hex[:8].upper()}",
+                transaction_id=f"TXN-{os.urandom(4).hex().upper()}",
                 amount=random.uniform(1000, 50000),
                 currency="USD",
-                timestamp=datetime.now() - timedelta(minutes=random.randint(10, 60)),
+                timestamp=now - timedelta(minutes=random.randint(10, 60)),
                 source_account=f"ACC-{random.randint(10000, 99999)}",
                 destination_account=f"ACC-{random.randint(10000, 99999)}",
                 channel="API",
                 ip_address=f"192.168.{random.randint(1, 255)}.{random.randint(1, 255)}",
             ),
-            feature_deviations=[
-                FeatureDeviation(
-                    feature="Transaction Amount",
-                    deviation="+340%",
-                    risk_level=RiskLevel.VERY_HIGH,
-                ),
-                FeatureDeviation(
-                    feature="Time of Day",
-                    deviation="Unusual Pattern",
-                    risk_level=RiskLevel.HIGH,
-                ),
-                FeatureDeviation(
-                    feature="Frequency",
-                    deviation="+8x Normal Rate",
-                    risk_level=RiskLevel.HIGH,
-                ),
-                FeatureDeviation(
-                    feature="Geographic Location",
-                    deviation="New Country",
-                    risk_level=RiskLevel.MEDIUM,
-                ),
-            ],
+            feature_deviations=list(_FEATURE_DEVIATIONS),
             historical_scores=[15, 18, 22, 25, 35, 94],
         )
     
@@ -166,7 +245,8 @@ class AlertService:
         current_status = AlertStatus.ACTIVE
         
         # Validate transition
-        if new_status not in self.VALID_TRANSITIONS.get(current_status, []):
+        allowed = self.VALID_TRANSITIONS.get(current_status, self.NO_TRANSITIONS)
+        if new_status not in allowed:
             raise BusinessRuleViolation(
                 f"Invalid status transition: {current_status} → {new_status}"
             )
@@ -183,38 +263,133 @@ class AlertService:
         
         return True
     
-    def _get_severity_from_score(self, score: float) -> AlertSeverity:
+    async def bulk_update_status(
+        self,
+        changes: Sequence[Tuple[str, AlertStatus]],
+    ) -> BulkStatusUpdateResult:
+        """
+        Update many alert statuses with per-chunk round-trips.
+        
+        Each chunk of BULK_CHUNK_SIZE changes costs one status lookup and
+        one UPDATE instead of a pair per alert. Invalid transitions and
+        unknown alerts are rejected individually; the rest are applied.
+        Every change is checked against the status before the batch, so an
+        alert may appear only once.
+        """
+        logger.info("Bulk updating alert status", count=len(changes))
+        
+        if len({alert_id for alert_id, _ in changes}) != len(changes):
+            raise ValidationError("Each alert may appear only once in a bulk status update")
+        
+        updated: List[str] = []
+        rejected: Dict[str, str] = {}
+        
+        for start in range(0, len(changes), self.BULK_CHUNK_SIZE):
+            chunk = changes[start:start + self.BULK_CHUNK_SIZE]
+            alert_ids = [alert_id for alert_id, _ in chunk]
+            
+            if self.alert_repo.session is not None:
+                current = await self.alert_repo.get_statuses(alert_ids)
+            else:
+                # Mock: every alert is ACTIVE, as in update_status
+                current = dict.fromkeys(alert_ids, AlertStatus.ACTIVE)
+            
+            valid = []
+            for alert_id, new_status in chunk:
+                current_status = current.get(alert_id)
+                if current_status is None:
+                    rejected[alert_id] = f"Alert {alert_id} not found"
+                elif new_status not in self.VALID_TRANSITIONS.get(current_status, self.NO_TRANSITIONS):
+                    rejected[alert_id] = f"Invalid status transition: {current_status} → {new_status}"
+                else:
+                    valid.append((alert_id, new_status))
+            
+            if valid:
+                await self.alert_repo.apply_status_updates(valid)
+                updated.extend(alert_id for alert_id, _ in valid)
+        
+        logger.info("Alert statuses updated", updated=len(updated), rejected=len(rejected))
+        
+        return BulkStatusUpdateResult(updated=updated, rejected=rejected)
+    
+    @staticmethod
+    def _to_alert(row: Row) -> Alert:
+        """Map an alert list row (ALERT_LIST_COLUMNS) to the API schema."""
+        return Alert(
+            alert_id=row.alert_id,
+            timestamp=row.detection_time,
+            entity=row.entity,
+            entity_type=row.entity_type,
+            risk_score=row.risk_score,
+            severity=row.severity,
+            status=row.status,
+        )
+    
+    @staticmethod
+    def _get_severity_from_score(score: float) -> AlertSeverity:
         """Determine severity from risk score."""
-        if score >= 90:
-            return AlertSeverity.CRITICAL
-        elif score >= 70:
-            return AlertSeverity.HIGH
-        elif score >= 50:
-            return AlertSeverity.MEDIUM
-        else:
-            return AlertSeverity.LOW
+        return _SEV_LEVELS[bisect_right(_SEV_THRESHOLDS, score)]
     
-    def _generate_mock_alerts(self) -> List[Alert]:
-        """Generate mock alert data for MVP."""
+    @staticmethod
+    def _generate_mock_alerts() -> Tuple[Alert, ...]:
+        """
+        Generate mock alert data for MVP.
+        
+        Seeded and anchored to _MOCK_EPOCH, so every call yields the same
+        alerts. Built with model_construct since the generated fields are
+        already well-typed.
+        """
+        rng = random.Random(42)
+        now = _MOCK_EPOCH
         alerts = []
         statuses = [AlertStatus.ACTIVE] * 5 + [AlertStatus.INVESTIGATING] * 2 + [
             AlertStatus.RESOLVED, AlertStatus.FALSE_POSITIVE
         ]
         
         for i in range(15):
-            score = random.uniform(30, 98)
-            alerts.append(Alert(
+            score = rng.uniform(30, 98)
+            alerts.append(Alert.model_construct(
                 alert_id=f"ALT-{str(i + 1).zfill(3)}",
-                timestamp=datetime.now() - timedelta(minutes=random.randint(5, 300)),
-                entity=random.choice([
-                    f"User #{random.randint(10000, 99999)}",
-                    f"Account #{random.randint(1000, 9999)}",
-                    f"Transaction #{random.randint(100000, 999999)}",
+                timestamp=now - timedelta(minutes=rng.randint(5, 300)),
+                entity=rng.choice([
+                    f"User #{rng.randint(10000, 99999)}",
+                    f"Account #{rng.randint(1000, 9999)}",
+                    f"Transaction #{rng.randint(100000, 999999)}",
                 ]),
-                entity_type=random.choice(list(EntityType)),
+                entity_type=rng.choice(list(EntityType)),
                 risk_score=round(score, 1),
-                severity=self._get_severity_from_score(score),
-                status=random.choice(statuses),
+                severity=AlertService._get_severity_from_score(score),
+                status=rng.choice(statuses),
             ))
         
-        return alerts
+        return tuple(alerts)
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _mock_alert_index() -> _MockAlertIndex:
+        """
+        Index the mock snapshot, like the database's list indexes.
+        
+        Every bucket keeps the (timestamp, alert_id) descending order of
+        sorted_by_ts, so filtered results never need re-sorting. The index
+        is shared by every request for the process lifetime, so callers
+        must not mutate it.
+        """
+        sorted_by_ts = tuple(sorted(
+            AlertService._generate_mock_alerts(),
+            key=_ALERT_SORT_KEY,
+            reverse=True,
+        ))
+        
+        by_severity: Dict[AlertSeverity, List[Alert]] = {}
+        by_status: Dict[AlertStatus, List[Alert]] = {}
+        for alert in sorted_by_ts:
+            by_severity.setdefault(alert.severity, []).append(alert)
+            by_status.setdefault(alert.status, []).append(alert)
+        
+        return _MockAlertIndex(
+            sorted_by_ts=sorted_by_ts,
+            by_severity={k: tuple(v) for k, v in by_severity.items()},
+            by_status={k: tuple(v) for k, v in by_status.items()},
+            search_keys={a.alert_id: (a.alert_id.lower(), a.entity.lower()) for a in sorted_by_ts},
+        )
@@ -16,10 +16,17 @@ from app.models.schemas import (
 )
 from app.db.repositories.alert_repository import AlertRepository
 from app.db.repositories.feedback_repository import FeedbackRepository
+from app.core.cache import async_ttl_cache
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Analytics change slowly; serve repeated requests from memory for this long
+CACHE_TTL_SECONDS = 60
+
+# Age of each mock model version release, oldest first
+_MODEL_VERSION_AGES = tuple(timedelta(days=days) for days in (120, 90, 60, 30, 0))
+
 
 class AnalyticsService:
     """Service for analytics and model performance metrics."""
@@ -32,6 +39,7 @@ class AnalyticsService:
         self.alert_repo = alert_repo
         self.feedback_repo = feedback_repo
     
+    @async_ttl_cache(ttl=CACHE_TTL_SECONDS)
     async def get_metrics(self) -> AnalyticsMetrics:
         """
         Get overall model performance metrics.
@@ -52,6 +60,7 @@ class AnalyticsService:
             alert_volume_daily=2400,
         )
     
+    @async_ttl_cache(ttl=CACHE_TTL_SECONDS)
     async def get_model_performance(self, range: str = "7d") -> ModelPerformance:
         """
         Get model performance over time.
@@ -60,18 +69,14 @@ class AnalyticsService:
         """
         logger.info("Fetching model performance", range=range)
         
+        now = datetime.now()
         return ModelPerformance(
             versions=["v1.0", "v1.5", "v2.0", "v2.5", "v3.0"],
             accuracy=[82.5, 85.3, 89.1, 92.8, 94.2],
-            timestamps=[
-                datetime.now() - timedelta(days=120),
-                datetime.now() - timedelta(days=90),
-                datetime.now() - timedelta(days=60),
-                datetime.now() - timedelta(days=30),
-                datetime.now(),
-            ],
+            timestamps=[now - age for age in _MODEL_VERSION_AGES],
         )
     
+    @async_ttl_cache(ttl=CACHE_TTL_SECONDS)
     async def get_alert_volume(
         self,
         range: str = "7d",
@@ -99,6 +104,7 @@ class AnalyticsService:
         
         return AlertVolume(labels=labels, alerts=alerts, frauds=frauds)
     
+    @async_ttl_cache(ttl=CACHE_TTL_SECONDS)
     async def get_confusion_matrix(
         self,
         start_date: Optional[date] = None,
@@ -123,6 +129,7 @@ class AnalyticsService:
             false_negatives=12,
         )
     
+    @async_ttl_cache(ttl=CACHE_TTL_SECONDS)
     async def get_detection_rate(self, range: str = "7d") -> dict:
         """
         Get fraud detection rate over time.
@@ -5,8 +5,9 @@ Business logic for dashboard metrics and visualizations.
 """
 
 from datetime import datetime, timedelta
-from typing import List
-import random
+from typing import List, Tuple
+
+import numpy as np
 
 from app.models.schemas import (
     DashboardMetrics,
@@ -15,10 +16,41 @@ from app.models.schemas import (
     SeverityDistribution,
 )
 from app.db.repositories.alert_repository import AlertRepository
+from app.core.cache import async_ttl_cache
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Dashboard figures change slowly; serve repeated requests from memory for this long
+CACHE_TTL_SECONDS = 60
+
+# Mock trend shapes: chart labels and inclusive (low, high) bounds per bucket
+_rng = np.random.default_rng()
+
+_HOURLY_LABELS = tuple(f"{h:02d}:00" for h in range(0, 24, 2))
+_HOURLY_BOUNDS = (
+    # early morning low, morning increase, peak hours, afternoon peak, evening decline, night
+    np.array([20, 25, 30, 40, 50, 60, 70, 75, 80, 70, 55, 35]),
+    np.array([40, 45, 50, 60, 70, 85, 95, 90, 100, 85, 70, 50]),
+)
+
+_DAILY_LABELS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_DAILY_BOUNDS = (
+    np.array([200, 250, 220, 280, 350, 300, 250]),  # Friday peak
+    np.array([300, 350, 320, 380, 450, 400, 350]),
+)
+
+_MONTHLY_LABELS = tuple(f"Day {i}" for i in range(1, 31))
+_MONTHLY_BOUNDS = (np.full(30, 180), np.full(30, 400))
+
+# Mock distribution, built once and shared by every request
+SEVERITY_DISTRIBUTION: Tuple[SeverityDistribution, ...] = (
+    SeverityDistribution(name="Critical", value=15, color="hsl(0, 84%, 50%)"),
+    SeverityDistribution(name="High", value=35, color="hsl(0, 84%, 60%)"),
+    SeverityDistribution(name="Medium", value=45, color="hsl(54, 92%, 50%)"),
+    SeverityDistribution(name="Low", value=25, color="hsl(120, 73%, 55%)"),
+)
+
 
 class DashboardService:
     """Service for dashboard-related business logic."""
@@ -26,6 +58,7 @@ class DashboardService:
     def __init__(self, alert_repo: AlertRepository):
         self.alert_repo = alert_repo
     
+    @async_ttl_cache(ttl=CACHE_TTL_SECONDS)
     async def get_metrics(self) -> DashboardMetrics:
         """
         Get dashboard overview metrics.
@@ -53,45 +86,25 @@ class DashboardService:
             ),
         )
     
-    async def get_alerts_trend(self, range: str = "24h") -> AlertsTrend:
+    @async_ttl_cache(ttl=CACHE_TTL_SECONDS)
+    async def get_alerts_trend(self, time_range: str = "24h") -> AlertsTrend:
         """
         Get alerts trend data for charting.
         
-        Returns hourly/daily alert counts based on range.
+        Returns hourly/daily alert counts based on time_range.
         """
-        logger.info("Fetching alerts trend", range=range)
+        logger.info("Fetching alerts trend", range=time_range)
         
-        if range == "24h":
+        if time_range == "24h":
             # Hourly data
-            timestamps = [f"{h:02d}:00" for h in range(0, 24, 2)]
-            values = [
-                random.randint(20, 40),  # Early morning low
-                random.randint(25, 45),
-                random.randint(30, 50),
-                random.randint(40, 60),  # Morning increase
-                random.randint(50, 70),
-                random.randint(60, 85),  # Peak hours
-                random.randint(70, 95),
-                random.randint(75, 90),
-                random.randint(80, 100), # Afternoon peak
-                random.randint(70, 85),
-                random.randint(55, 70),  # Evening decline
-                random.randint(35, 50),  # Night
-            ]
-        elif range == "7d":
-            timestamps = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-            values = [
-                random.randint(200, 300),
-                random.randint(250, 350),
-                random.randint(220, 320),
-                random.randint(280, 380),
-                random.randint(350, 450),  # Friday peak
-                random.randint(300, 400),
-                random.randint(250, 350),
-            ]
+            labels, (lows, highs) = _HOURLY_LABELS, _HOURLY_BOUNDS
+        elif time_range == "7d":
+            labels, (lows, highs) = _DAILY_LABELS, _DAILY_BOUNDS
         else:  # 30d
-            timestamps = [f"Day {i}" for i in range(1, 31)]
-            values = [random.randint(180, 400) for _ in range(30)]
+            labels, (lows, highs) = _MONTHLY_LABELS, _MONTHLY_BOUNDS
+        
+        timestamps = list(labels)
+        values = _rng.integers(lows, highs, endpoint=True).tolist()
         
         return AlertsTrend(timestamps=timestamps, values=values)
     
@@ -103,10 +116,4 @@ class DashboardService:
         """
         logger.info("Fetching severity distribution")
         
-        # Mock distribution
-        return [
-            SeverityDistribution(name="Critical", value=15, color="hsl(0, 84%, 50%)"),
-            SeverityDistribution(name="High", value=35, color="hsl(0, 84%, 60%)"),
-            SeverityDistribution(name="Medium", value=45, color="hsl(54, 92%, 50%)"),
-            SeverityDistribution(name="Low", value=25, color="hsl(120, 73%, 55%)"),
-        ]
+        return list(SEVERITY_DISTRIBUTION)
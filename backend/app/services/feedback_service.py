@@ -4,8 +4,13 @@ Feedback Service
 Business logic for feedback history and analyst decision tracking.
 """
 
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Optional, List
+from functools import lru_cache
+from operator import attrgetter
+from typing import Optional, List, Tuple
+import logging
+import os
 import random
 import uuid
 
@@ -17,12 +22,21 @@ from app.models.schemas import (
     PaginationInfo,
 )
 from app.models.enums import FeedbackDecision
-from app.db.repositories.feedback_repository import FeedbackRepository
+from app.db.models import FeedbackModel
+from app.db.repositories.feedback_repository import FeedbackRepository, range_to_days
 from app.db.repositories.alert_repository import AlertRepository
-from app.core.logging import get_logger
+from app.core.logging import get_logger, is_log_enabled
+from app.core.pagination import decode_cursor, encode_cursor
 
 logger = get_logger(__name__)
 
+# Mock list order (newest first, feedback_id breaks ties); also the keyset cursor key
+_FEEDBACK_SORT_KEY = attrgetter("resolved_at", "feedback_id")
+
+# Mock timestamps are offsets from process start, so the snapshot is the
+# same on every build and keyset cursors stay valid for the process lifetime
+_MOCK_EPOCH = datetime.now()
+
 
 class FeedbackService:
     """Service for feedback and resolution history."""
@@ -41,46 +55,83 @@ class FeedbackService:
         
         Shows resolved alerts with decisions and analyst notes.
         """
-        logger.info("Fetching feedback history", filters=filters.model_dump())
-        
-        # Generate mock data
-        all_feedback = self._generate_mock_feedback()
-        
-        # Apply filters
-        filtered = all_feedback
-        
-        if filters.decision:
-            filtered = [f for f in filtered if f.decision == filters.decision]
-        
-        if filters.analyst:
-            filtered = [f for f in filtered if filters.analyst.lower() in f.analyst.lower()]
-        
-        # Sort by resolved_at descending
-        filtered.sort(key=lambda x: x.resolved_at, reverse=True)
+        if is_log_enabled(logging.INFO):
+            logger.info("Fetching feedback history", filters=filters.model_dump())
         
-        # Paginate
-        total = len(filtered)
-        start = (filters.page - 1) * filters.limit
-        end = start + filters.limit
-        page_feedback = filtered[start:end]
+        # Keyset cursor (resolved_at, id) of the last record already seen
+        after = decode_cursor(filters.cursor) if filters.cursor else None
+        next_cursor = None
         
-        total_pages = (total + filters.limit - 1) // filters.limit
+        if self.feedback_repo.session is not None:
+            # Filtering, ordering and paging happen in the database
+            if after is None:
+                rows, total = await self.feedback_repo.list(filters)
+                has_next = filters.page * filters.limit < total
+            else:
+                rows = await self.feedback_repo.list_after(filters, after)
+                has_next = len(rows) > filters.limit
+                rows = rows[:filters.limit]
+            page_feedback = [self._to_feedback(row) for row in rows]
+            if has_next and rows:
+                next_cursor = encode_cursor(rows[-1].resolved_at, rows[-1].id)
+            
+            stats = await self.feedback_repo.get_summary_stats(range_to_days(filters.range))
+            total_resolutions = stats["total"]
+            fraud_count = stats["frauds"]
+            fp_count = stats["false_positives"]
+        else:
+            # Serve the cached mock snapshot
+            want_decision = filters.decision
+            analyst_lower = filters.analyst.lower() if filters.analyst else None
+            
+            # Apply all filters in one pass over the pre-sorted rows
+            mock_rows = self._mock_feedback_rows()
+            filtered = [
+                f for f, f_analyst_lower in mock_rows
+                if (want_decision is None or f.decision in want_decision)
+                and (analyst_lower is None or analyst_lower in f_analyst_lower)
+            ]
+            
+            # Paginate
+            total = len(filtered)
+            if after is None:
+                start = (filters.page - 1) * filters.limit
+            else:
+                start = next(
+                    (i for i, f in enumerate(filtered) if _FEEDBACK_SORT_KEY(f) < after),
+                    total,
+                )
+            end = start + filters.limit
+            page_feedback = filtered[start:end]
+            has_next = end < total
+            if has_next and page_feedback:
+                next_cursor = encode_cursor(page_feedback[-1].resolved_at, page_feedback[-1].feedback_id)
+            
+            # Calculate summary
+            total_resolutions = len(mock_rows)
+            counts = Counter(f.decision for f, _ in mock_rows)
+            fraud_count = counts[FeedbackDecision.FRAUD]
+            fp_count = counts[FeedbackDecision.FALSE_POSITIVE]
         
-        # Calculate summary
-        fraud_count = sum(1 for f in all_feedback if f.decision == FeedbackDecision.FRAUD)
-        fp_count = sum(1 for f in all_feedback if f.decision == FeedbackDecision.FALSE_POSITIVE)
+        # Cursor pages are not counted: the total would cost a full scan per page
+        total_records: Optional[int] = None
+        total_pages: Optional[int] = None
+        if after is None:
+            total_records = total
+            total_pages = (total + filters.limit - 1) // filters.limit
         
         return FeedbackResult(
             feedback=page_feedback,
             pagination=PaginationInfo(
                 page=filters.page,
                 total_pages=total_pages,
-                total_records=total,
-                has_next=filters.page < total_pages,
-                has_previous=filters.page > 1,
+                total_records=total_records,
+                has_next=has_next,
+                has_previous=after is not None or filters.page > 1,
+                next_cursor=next_cursor,
             ),
             summary=FeedbackSummary(
-                total_resolutions=len(all_feedback),
+                total_resolutions=total_resolutions,
                 confirmed_frauds=fraud_count,
                 false_positives=fp_count,
                 resolution_rate=95.2,
@@ -102,7 +153,8 @@ class FeedbackService:
         """Get detailed feedback record."""
         logger.info("Fetching feedback detail", feedback_id=feedback_id)
         
-        return Feedback(
+        # Trusted mock fields: skip validation
+        return Feedback.model_construct(
             feedback_id=feedback_id,
             alert_id=f"ALT-{random.randint(1, 100):03d}",
             entity=f"User #{random.randint(10000, 99999)}",
@@ -121,27 +173,53 @@ class FeedbackService:
         """Get feedback history for a specific analyst."""
         logger.info("Fetching analyst feedback", analyst_id=analyst_id, page=page)
         
-        # Mock data
+        # Mock data (trusted fields: skip validation)
+        count = min(limit, 10)
+        now = datetime.now()
+        # One urandom read for every record's UUID4 instead of one per uuid4()
+        entropy = os.urandom(16 * count)
         return [
-            Feedback(
-                feedback_id=str(uuid.uuid4()),
+            Feedback.model_construct(
+                feedback_id=str(uuid.UUID(bytes=entropy[16 * i:16 * (i + 1)], version=4)),
                 alert_id=f"ALT-{random.randint(1, 100):03d}",
                 entity=f"User #{random.randint(10000, 99999)}",
                 decision=random.choice([FeedbackDecision.FRAUD, FeedbackDecision.FALSE_POSITIVE]),
                 notes="Investigation completed.",
-                resolved_at=datetime.now() - timedelta(hours=random.randint(1, 168)),
+                resolved_at=now - timedelta(hours=random.randint(1, 168)),
                 analyst=analyst_id,
             )
-            for _ in range(min(limit, 10))
+            for i in range(count)
         ]
     
-    def _generate_mock_feedback(self) -> List[Feedback]:
-        """Generate mock feedback data."""
+    @staticmethod
+    def _to_feedback(row: FeedbackModel) -> Feedback:
+        """Map a feedback row (with its alert loaded) to the API schema."""
+        return Feedback(
+            feedback_id=row.feedback_id,
+            alert_id=row.alert.alert_id,
+            entity=row.alert.entity,
+            decision=row.decision,
+            notes=row.notes,
+            resolved_at=row.resolved_at,
+            analyst=row.analyst_name or row.analyst_id or "unknown",
+        )
+    
+    @staticmethod
+    def _generate_mock_feedback() -> Tuple[Feedback, ...]:
+        """
+        Generate mock feedback data.
+        
+        Seeded and anchored to _MOCK_EPOCH, so every call yields the same
+        records. Built with model_construct since the generated fields are
+        already well-typed.
+        """
+        rng = random.Random(42)
+        now = _MOCK_EPOCH
         analysts = ["John Smith", "Sarah Johnson", "Michael Chen", "Emma Davis", "Robert Wilson"]
         
         feedback_list = []
         for i in range(25):
-            is_fraud = random.random() > 0.3  # 70% fraud rate
+            is_fraud = rng.random() > 0.3  # 70% fraud rate
             
             notes_fraud = [
                 "Unusual location, confirmed with customer",
@@ -156,14 +234,32 @@ class FeedbackService:
                 "Bulk purchase by authorized distributor",
             ]
             
-            feedback_list.append(Feedback(
+            feedback_list.append(Feedback.model_construct(
                 feedback_id=f"FBK-{str(i + 1).zfill(3)}",
-                alert_id=f"ALT-{str(random.randint(1, 100)).zfill(3)}",
-                entity=f"User #{random.randint(10000, 99999)}",
+                alert_id=f"ALT-{str(rng.randint(1, 100)).zfill(3)}",
+                entity=f"User #{rng.randint(10000, 99999)}",
                 decision=FeedbackDecision.FRAUD if is_fraud else FeedbackDecision.FALSE_POSITIVE,
-                notes=random.choice(notes_fraud if is_fraud else notes_fp),
-                resolved_at=datetime.now() - timedelta(hours=random.randint(1, 168)),
-                analyst=random.choice(analysts),
+                notes=rng.choice(notes_fraud if is_fraud else notes_fp),
+                resolved_at=now - timedelta(hours=rng.randint(1, 168)),
+                analyst=rng.choice(analysts),
             ))
         
-        return feedback_list
+        return tuple(feedback_list)
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _mock_feedback_rows() -> Tuple[Tuple[Feedback, str], ...]:
+        """
+        Mock feedback newest first, each paired with its lowercased analyst.
+        
+        Shared by every request for the process lifetime, so callers must
+        not mutate the records.
+        """
+        return tuple(
+            (f, f.analyst.lower())
+            for f in sorted(
+                FeedbackService._generate_mock_feedback(),
+                key=_FEEDBACK_SORT_KEY,
+                reverse=True,
+            )
+        )
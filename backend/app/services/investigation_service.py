@@ -5,10 +5,20 @@ Business logic for fraud investigations and decision submission.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, AsyncIterator, Callable, Coroutine, Dict, List, NamedTuple, Optional, Set, Tuple
+import asyncio
+import contextlib
+import logging
+import os
 import random
+import re
 import uuid
 
+import orjson
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
 from app.models.schemas import (
     Investigation,
     InvestigationNote,
@@ -18,29 +28,258 @@ from app.models.schemas import (
 )
 from app.models.enums import (
     AlertStatus,
+    FeedbackDecision,
+    InvestigationAction,
     InvestigationDecision,
     EntityType,
     RiskLevel,
 )
+from app.db.models import AlertModel, FeedbackModel, InvestigationModel
+from app.db.session import get_db_session
 from app.db.repositories.alert_repository import AlertRepository
 from app.db.repositories.transaction_repository import TransactionRepository
 from app.db.repositories.feedback_repository import FeedbackRepository
+from app.config import settings
+from app.core.cache import TTLCache
 from app.core.errors import NotFoundError, BusinessRuleViolation
-from app.core.logging import get_logger
+from app.core.logging import get_logger, is_log_enabled
+from app.core.responses import ORJSON_OPTIONS
 
 logger = get_logger(__name__)
 
+# Assembled investigations by alert_id. Analysts reopen the same alert
+# repeatedly (refresh, tab switch); decisions and notes invalidate the entry.
+INVESTIGATION_CACHE_TTL_SECONDS = 30
+_investigation_cache = TTLCache(maxsize=256, ttl=INVESTIGATION_CACHE_TTL_SECONDS)
+
+# Caps the background writes that open their own sessions (decision feedback,
+# note batches) at the pool size, so a burst of them queues here instead of
+# holding every pool connection while requests wait for one
+_db_session_slots = asyncio.Semaphore(settings.DATABASE_POOL_SIZE)
+
+# Investigation timelines by alert_id; they only change through decisions and notes
+HISTORY_CACHE_TTL_SECONDS = 60
+_history_cache = TTLCache(maxsize=1024, ttl=HISTORY_CACHE_TTL_SECONDS)
+_history_json_cache = TTLCache(maxsize=1024, ttl=HISTORY_CACHE_TTL_SECONDS)
+
+# Ages of the mock transaction and history events relative to the request
+_TRANSACTION_AGE = timedelta(minutes=30)
+_ALERT_CREATED_AGE = timedelta(hours=2)
+_STATUS_CHANGED_AGE = timedelta(hours=1)
+_NOTE_ADDED_AGE = timedelta(minutes=30)
+
+# Mock investigation context, built once and shared by every request
+_FEATURE_DEVIATIONS: Tuple[FeatureDeviation, ...] = (
+    FeatureDeviation(
+        feature="Transaction Amount",
+        deviation="+340%",
+        risk_level=RiskLevel.VERY_HIGH,
+        value=45230,
+        baseline=10300,
+    ),
+    FeatureDeviation(
+        feature="Time of Day",
+        deviation="Unusual Pattern",
+        risk_level=RiskLevel.HIGH,
+    ),
+    FeatureDeviation(
+        feature="Frequency",
+        deviation="+8x Normal Rate",
+        risk_level=RiskLevel.HIGH,
+        value=8,
+        baseline=1,
+    ),
+    FeatureDeviation(
+        feature="Geographic Location",
+        deviation="New Country",
+        risk_level=RiskLevel.MEDIUM,
+    ),
+    FeatureDeviation(
+        feature="Device Fingerprint",
+        deviation="New Device",
+        risk_level=RiskLevel.MEDIUM,
+    ),
+)
+
+_HISTORICAL_BEHAVIOR: Tuple[Dict[str, Any], ...] = (
+    {"date": "5 days ago", "score": 15},
+    {"date": "4 days ago", "score": 18},
+    {"date": "3 days ago", "score": 22},
+    {"date": "2 days ago", "score": 25},
+    {"date": "Yesterday", "score": 35},
+    {"date": "Today", "score": 94},
+)
+
+# Fire-and-forget writes still running (the event loop only keeps weak references)
+_background_tasks: Set[asyncio.Task] = set()
+
+# Notes are buffered briefly so bursts are written in one transaction; a
+# batch that fails to write goes back into the buffer and is retried
+NOTE_FLUSH_DELAY_SECONDS = 0.1
+NOTE_RETRY_DELAY_SECONDS = 1.0
+_pending_notes: List[Tuple[str, InvestigationNote]] = []  # (alert_id, note)
+_note_flush_task: Optional[asyncio.Task] = None  # coalescing timer, until it fires
+_note_write_lock = asyncio.Lock()  # held while a batch is being written
+
+_ALERT_ID_RE = re.compile(r"\AALT-[A-Z0-9]+\Z").match
+
+
+def _validate_alert_id(alert_id: str) -> None:
+    """Reject malformed alert IDs before any lookup."""
+    if _ALERT_ID_RE(alert_id) is None:
+        raise NotFoundError(f"Alert {alert_id} not found")
+
+
+def _spawn(coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+    """Run `coro` as a background task, keeping a reference until it finishes."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def _spawn_after_commit(
+    session: AsyncSession,
+    make_coro: Callable[[], Coroutine[Any, Any, None]],
+) -> None:
+    """Spawn `make_coro()` once `session` commits; drop it if it rolls back."""
+    pending = True
+    
+    def on_commit(_session: Session) -> None:
+        nonlocal pending
+        if pending:
+            pending = False
+            _spawn(make_coro())
+    
+    def on_rollback(_session: Session) -> None:
+        nonlocal pending
+        pending = False
+    
+    event.listen(session.sync_session, "after_commit", on_commit, once=True)
+    event.listen(session.sync_session, "after_rollback", on_rollback, once=True)
+
+
+async def drain_background_tasks() -> None:
+    """Wait for in-flight background writes. Called on application shutdown."""
+    if _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+
+
+def _invalidate_cached(alert_id: str) -> None:
+    """Drop an alert's cached investigation and timeline after a write."""
+    _investigation_cache.pop(alert_id)
+    _history_cache.pop(alert_id)
+    _history_json_cache.pop(alert_id)
+
+
+def _queue_note(alert_id: str, note: InvestigationNote) -> None:
+    """Buffer a note, starting a flush timer if none is pending."""
+    _pending_notes.append((alert_id, note))
+    _schedule_note_flush(NOTE_FLUSH_DELAY_SECONDS)
+
+
+def _schedule_note_flush(delay: float) -> None:
+    """Start the flush timer unless one is already pending."""
+    global _note_flush_task
+    if _note_flush_task is None:
+        _note_flush_task = _spawn(_flush_notes_after(delay))
+
+
+async def _flush_notes_after(delay: float) -> None:
+    """Write the buffered notes once the window has passed, retrying on failure."""
+    global _note_flush_task
+    await asyncio.sleep(delay)
+    _note_flush_task = None
+    if not await _write_pending_notes():
+        _schedule_note_flush(NOTE_RETRY_DELAY_SECONDS)
+
+
+async def _write_pending_notes() -> bool:
+    """
+    Write every buffered note in one session.
+    
+    Returns False if the write failed; the batch is then put back at the
+    front of the buffer, ahead of notes queued in the meantime.
+    """
+    async with _note_write_lock:
+        if not _pending_notes:
+            return True
+        batch = _pending_notes[:]
+        _pending_notes.clear()
+        
+        try:
+            async with _db_session_slots, get_db_session() as session:
+                written = await AlertRepository(session).add_notes(batch)
+        except Exception:
+            _pending_notes[:0] = batch
+            logger.exception("Failed to write investigation notes", count=len(batch))
+            return False
+    
+    if written < len(batch):
+        logger.warning("Dropped notes for unknown alerts", count=len(batch) - written)
+    # Reads during the window may have cached a timeline without these notes
+    for alert_id in {alert_id for alert_id, _ in batch}:
+        _invalidate_cached(alert_id)
+    return True
+
+
+async def drain_note_buffer() -> None:
+    """
+    Write any buffered notes now. Called on application shutdown.
+    
+    A pending timer is still sleeping (it clears its handle before writing),
+    so cancelling it never interrupts a write; a write already in progress
+    holds the lock, and this waits for it before flushing the rest. Notes
+    that still cannot be written are logged in full rather than dropped
+    silently.
+    """
+    global _note_flush_task
+    timer, _note_flush_task = _note_flush_task, None
+    if timer is not None:
+        timer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await timer
+    if await _write_pending_notes():
+        return
+    
+    for alert_id, note in _pending_notes:
+        logger.error(
+            "Investigation note not persisted",
+            alert_id=alert_id,
+            note_id=note.note_id,
+            analyst_id=note.analyst_id,
+            timestamp=note.timestamp.isoformat(),
+            content=note.content,
+        )
+    _pending_notes.clear()
+
+
+class _DecisionOutcome(NamedTuple):
+    """Effect of an investigation decision on its alert."""
+    
+    status: AlertStatus
+    feedback: Optional[FeedbackDecision]
+
 
 class InvestigationService:
     """Service for investigation business logic."""
     
-    # Decision to status mapping
-    DECISION_STATUS_MAP = {
-        InvestigationDecision.FRAUD: AlertStatus.RESOLVED,
-        InvestigationDecision.LEGITIMATE: AlertStatus.FALSE_POSITIVE,
-        InvestigationDecision.REVIEW: AlertStatus.INVESTIGATING,
+    # Built per request; shared state (caches, buffers) lives at module level
+    __slots__ = ("alert_repo", "transaction_repo", "feedback_repo")
+    
+    # What each decision does: the alert's new status, and the feedback label
+    # for the ML loop (REVIEW is not final, so it records none)
+    DECISION_OUTCOMES: Dict[InvestigationDecision, _DecisionOutcome] = {
+        InvestigationDecision.FRAUD: _DecisionOutcome(AlertStatus.RESOLVED, FeedbackDecision.FRAUD),
+        InvestigationDecision.LEGITIMATE: _DecisionOutcome(
+            AlertStatus.FALSE_POSITIVE, FeedbackDecision.FALSE_POSITIVE
+        ),
+        InvestigationDecision.REVIEW: _DecisionOutcome(AlertStatus.INVESTIGATING, None),
     }
     
+    # Alerts that already carry a final label
+    CLOSED_STATUSES = frozenset({AlertStatus.RESOLVED, AlertStatus.FALSE_POSITIVE})
+    
     def __init__(
         self,
         alert_repo: AlertRepository,
@@ -61,71 +300,84 @@ class InvestigationService:
         - Feature deviations (what triggered the alert)
         - Historical behavior patterns
         - Investigation notes
+        
+        The parts are independent, so they are loaded concurrently and the
+        request waits for the slowest one rather than their sum. Loaders
+        backed by the database must each use their own session: an
+        AsyncSession does not support concurrent operations.
+        
+        Results are cached per alert for INVESTIGATION_CACHE_TTL_SECONDS; the
+        cached object is shared between requests and must not be mutated.
+        The response is built from trusted server data with model_construct.
         """
-        logger.info("Fetching investigation", alert_id=alert_id)
+        if is_log_enabled(logging.INFO):
+            logger.info("Fetching investigation", alert_id=alert_id)
+        
+        _validate_alert_id(alert_id)
+        
+        cached = _investigation_cache.get(alert_id)
+        if cached is not None:
+            return cached
         
-        if not alert_id.startswith("ALT-"):
-            raise NotFoundError(f"Alert {alert_id} not found")
+        summary, transaction, feature_deviations, historical_behavior, notes = await asyncio.gather(
+            self._load_alert_summary(alert_id),
+            self._load_transaction(alert_id),
+            self._load_feature_deviations(alert_id),
+            self._load_historical_behavior(alert_id),
+            self._load_notes(alert_id),
+        )
         
-        # Build investigation context (mock data for MVP)
-        return Investigation(
+        investigation = Investigation.model_construct(
             alert_id=alert_id,
-            entity=f"User #{random.randint(10000, 99999)}",
-            status=AlertStatus.INVESTIGATING,
-            risk_score=94.5,
-            transaction=Transaction(
-                transaction_id=f"TXN-{uuid.uuid4().hex[:8].upper()}",
-                amount=45230.00,
-                currency="USD",
-                timestamp=datetime.now() - timedelta(minutes=30),
-                source_account="Account #42521",
-                destination_account="Account #8839",
-                channel="API",
-                ip_address="192.168.1.105",
-                device_fingerprint="fp_a1b2c3d4e5",
-            ),
-            feature_deviations=[
-                FeatureDeviation(
-                    feature="Transaction Amount",
-                    deviation="+340%",
-                    risk_level=RiskLevel.VERY_HIGH,
-                    value=45230,
-                    baseline=10300,
-                ),
-                FeatureDeviation(
-                    feature="Time of Day",
-                    deviation="Unusual Pattern",
-                    risk_level=RiskLevel.HIGH,
-                ),
-                FeatureDeviation(
-                    feature="Frequency",
-                    deviation="+8x Normal Rate",
-                    risk_level=RiskLevel.HIGH,
-                    value=8,
-                    baseline=1,
-                ),
-                FeatureDeviation(
-                    feature="Geographic Location",
-                    deviation="New Country",
-                    risk_level=RiskLevel.MEDIUM,
-                ),
-                FeatureDeviation(
-                    feature="Device Fingerprint",
-                    deviation="New Device",
-                    risk_level=RiskLevel.MEDIUM,
-                ),
-            ],
-            historical_behavior=[
-                {"date": "5 days ago", "score": 15},
-                {"date": "4 days ago", "score": 18},
-                {"date": "3 days ago", "score": 22},
-                {"date": "2 days ago", "score": 25},
-                {"date": "Yesterday", "score": 35},
-                {"date": "Today", "score": 94},
-            ],
-            notes=[],
+            **summary,
+            transaction=transaction,
+            feature_deviations=feature_deviations,
+            historical_behavior=historical_behavior,
+            notes=notes,
+        )
+        _investigation_cache.set(alert_id, investigation)
+        return investigation
+    
+    async def _load_alert_summary(self, alert_id: str) -> Dict[str, Any]:
+        """Load the alert's entity, status and score (mock data for MVP)."""
+        return {
+            "entity": f"User #{random.randint(10000, 99999)}",
+            "status": AlertStatus.INVESTIGATING,
+            "risk_score": 94.5,
+        }
+    
+    async def _load_transaction(self, alert_id: str) -> Optional[Transaction]:
+        """Load the transaction that triggered the alert."""
+        if self.transaction_repo.session is not None:
+            # The only database-backed loader so far, so it can use the request session
+            row = await self.transaction_repo.get_for_alert(alert_id)
+            return None if row is None else Transaction.model_validate(row)
+        
+        # Mock data for MVP
+        return Transaction.model_construct(
+            transaction_id=f"TXN-{os.urandom(4).hex().upper()}",
+            amount=45230.00,
+            currency="USD",
+            timestamp=datetime.now() - _TRANSACTION_AGE,
+            source_account="Account #42521",
+            destination_account="Account #8839",
+            channel="API",
+            ip_address="192.168.1.105",
+            device_fingerprint="fp_a1b2c3d4e5",
         )
     
+    async def _load_feature_deviations(self, alert_id: str) -> List[FeatureDeviation]:
+        """Load the feature deviations that triggered the alert (mock data for MVP)."""
+        return list(_FEATURE_DEVIATIONS)
+    
+    async def _load_historical_behavior(self, alert_id: str) -> List[Dict[str, Any]]:
+        """Load the entity's recent risk scores (mock data for MVP)."""
+        return [dict(entry) for entry in _HISTORICAL_BEHAVIOR]
+    
+    async def _load_notes(self, alert_id: str) -> List[InvestigationNote]:
+        """Load the investigation's notes (none in the MVP mock)."""
+        return []
+    
     async def submit_decision(
         self,
         alert_id: str,
@@ -139,94 +391,224 @@ class InvestigationService:
         Process:
         1. Validate alert exists and is in investigable state
         2. Update alert status based on decision
-        3. Record feedback for ML training loop
-        4. Create audit trail entry
+        3. Create audit trail entry
+        4. Record feedback for ML training loop (in the background)
         """
-        logger.info(
-            "Submitting investigation decision",
-            alert_id=alert_id,
-            decision=decision,
-            analyst_id=analyst_id,
-        )
+        if is_log_enabled(logging.INFO):
+            logger.info(
+                "Submitting investigation decision",
+                alert_id=alert_id,
+                decision=decision,
+                analyst_id=analyst_id,
+            )
         
         # Validate alert exists
-        if not alert_id.startswith("ALT-"):
-            raise NotFoundError(f"Alert {alert_id} not found")
+        _validate_alert_id(alert_id)
         
-        # Get new status from decision
-        new_status = self.DECISION_STATUS_MAP[decision]
+        # Get new status (and feedback label) from decision in one lookup
+        outcome = self.DECISION_OUTCOMES[decision]
+        new_status = outcome.status
         
-        # Update alert status
-        # await self.alert_repo.update_status(alert_id, new_status)
+        if self.alert_repo.session is not None:
+            alert = await self.alert_repo.get_by_id(alert_id)
+            if alert is None:
+                raise NotFoundError(f"Alert {alert_id} not found")
+            if alert.status in self.CLOSED_STATUSES:
+                raise BusinessRuleViolation(
+                    f"Alert {alert_id} is already closed ({alert.status.value})"
+                )
+            
+            # Status update and audit entry go out in one flush
+            await self.alert_repo.record_decision(
+                alert,
+                new_status,
+                [self._audit_entry(alert, decision, outcome, notes, analyst_id)],
+            )
+            
+            # The ML label is not needed for the response; write it once the
+            # request transaction commits, so a rolled-back decision leaves none
+            if outcome.feedback is not None:
+                feedback = outcome.feedback
+                _spawn_after_commit(
+                    self.alert_repo.session,
+                    lambda: self._record_feedback(alert.id, feedback, notes, analyst_id),
+                )
         
-        # Record feedback for ML loop
-        # await self.feedback_repo.create(...)
+        _invalidate_cached(alert_id)
         
-        logger.info(
-            "Decision recorded",
-            alert_id=alert_id,
-            decision=decision,
-            new_status=new_status,
-        )
+        if is_log_enabled(logging.INFO):
+            logger.info(
+                "Decision recorded",
+                alert_id=alert_id,
+                decision=decision,
+                new_status=new_status,
+            )
         
-        return InvestigationDecisionResult(
+        return InvestigationDecisionResult.model_construct(
             success=True,
             new_status=new_status,
         )
     
+    @staticmethod
+    def _audit_entry(
+        alert: AlertModel,
+        decision: InvestigationDecision,
+        outcome: _DecisionOutcome,
+        notes: Optional[str],
+        analyst_id: Optional[str],
+    ) -> InvestigationModel:
+        """Build the DECISION_SUBMITTED audit trail entry."""
+        return InvestigationModel(
+            alert_id=alert.id,
+            action=InvestigationAction.DECISION_SUBMITTED,
+            old_status=alert.status.value,
+            new_status=outcome.status.value,
+            decision=decision.value,
+            notes=notes,
+            analyst_id=analyst_id,
+        )
+    
+    @staticmethod
+    async def _record_feedback(
+        alert_pk: str,
+        feedback_decision: FeedbackDecision,
+        notes: Optional[str],
+        analyst_id: Optional[str],
+    ) -> None:
+        """
+        Write a decision's ML feedback label in its own session.
+        
+        Started in the background once the request transaction that recorded
+        the decision has committed, so failures are logged rather than raised.
+        """
+        try:
+            async with _db_session_slots, get_db_session() as session:
+                await FeedbackRepository(session).add(FeedbackModel(
+                    feedback_id=f"FBK-{os.urandom(4).hex().upper()}",
+                    alert_id=alert_pk,
+                    decision=feedback_decision,
+                    notes=notes,
+                    analyst_id=analyst_id,
+                ))
+        except Exception:
+            logger.exception("Failed to record decision feedback", alert_pk=alert_pk)
+    
     async def add_note(
         self,
         alert_id: str,
         note: str,
         analyst_id: Optional[str] = None,
-    ) -> None:
+    ) -> InvestigationNote:
         """
-        Add a note to an investigation.
+        Add a note to an investigation and return it.
         
-        Notes are append-only for audit purposes.
+        Notes are append-only for audit purposes. With a database, notes are
+        buffered for NOTE_FLUSH_DELAY_SECONDS and written in batches; failed
+        batches are retried, but notes still buffered when the process dies
+        are lost.
         """
-        logger.info("Adding investigation note", alert_id=alert_id)
+        if is_log_enabled(logging.INFO):
+            logger.info("Adding investigation note", alert_id=alert_id)
         
-        if not alert_id.startswith("ALT-"):
-            raise NotFoundError(f"Alert {alert_id} not found")
+        _validate_alert_id(alert_id)
         
-        # Create note (would save to DB)
-        note_entry = InvestigationNote(
-            note_id=str(uuid.uuid4()),
+        note_entry = InvestigationNote.model_construct(
+            note_id=uuid.uuid4().hex,
             content=note,
             analyst_id=analyst_id or "system",
             timestamp=datetime.now(),
         )
         
-        logger.info("Note added", alert_id=alert_id, note_id=note_entry.note_id)
+        if self.alert_repo.session is None:
+            logger.warning(
+                "Note not persisted without a database session",
+                alert_id=alert_id,
+                note_id=note_entry.note_id,
+            )
+            return note_entry
+        
+        _queue_note(alert_id, note_entry)
+        _invalidate_cached(alert_id)
+        
+        if is_log_enabled(logging.INFO):
+            logger.info("Note added", alert_id=alert_id, note_id=note_entry.note_id)
+        return note_entry
     
     async def get_history(self, alert_id: str) -> List[dict]:
         """
         Get complete investigation history.
         
-        Returns timeline of all actions taken on this alert.
+        Returns timeline of all actions taken on this alert. Timelines are
+        cached per alert for HISTORY_CACHE_TTL_SECONDS and must not be mutated.
+        """
+        if is_log_enabled(logging.INFO):
+            logger.info("Fetching investigation history", alert_id=alert_id)
+        
+        _validate_alert_id(alert_id)
+        
+        return self._cached_history(alert_id)
+    
+    async def get_history_json(self, alert_id: str) -> bytes:
+        """
+        Get the serialized history document `{"alert_id", "history"}`.
+        
+        The encoded bytes are cached alongside the timeline, so repeated
+        reads skip serialization as well as the lookup.
         """
-        logger.info("Fetching investigation history", alert_id=alert_id)
+        if is_log_enabled(logging.INFO):
+            logger.info("Fetching investigation history", alert_id=alert_id)
         
-        if not alert_id.startswith("ALT-"):
-            raise NotFoundError(f"Alert {alert_id} not found")
+        _validate_alert_id(alert_id)
         
-        # Mock history
+        body = _history_json_cache.get(alert_id)
+        if body is None:
+            history = self._cached_history(alert_id)
+            body = orjson.dumps({"alert_id": alert_id, "history": history}, option=ORJSON_OPTIONS)
+            _history_json_cache.set(alert_id, body)
+        return body
+    
+    def _cached_history(self, alert_id: str) -> List[dict]:
+        """Return the cached timeline for a validated alert ID, building it on a miss."""
+        history = _history_cache.get(alert_id)
+        if history is None:
+            history = self._build_history()
+            _history_cache.set(alert_id, history)
+        return history
+    
+    async def iter_history(self, alert_id: str) -> AsyncIterator[dict]:
+        """
+        Get an alert's timeline as an async iterator of entries.
+        
+        The alert ID is checked before the iterator is returned, so a bad ID
+        fails before a streaming response starts.
+        """
+        _validate_alert_id(alert_id)
+        return self._history_entries(alert_id)
+    
+    async def _history_entries(self, alert_id: str) -> AsyncIterator[dict]:
+        """Yield timeline entries oldest first."""
+        for entry in await self.get_history(alert_id):
+            yield entry
+    
+    @staticmethod
+    def _build_history() -> List[dict]:
+        """Build an alert's action timeline (mock data for MVP)."""
+        now = datetime.now()
         return [
             {
-                "timestamp": (datetime.now() - timedelta(hours=2)).isoformat(),
+                "timestamp": (now - _ALERT_CREATED_AGE).isoformat(),
                 "action": "ALERT_CREATED",
                 "details": "Alert generated by detection engine",
             },
             {
-                "timestamp": (datetime.now() - timedelta(hours=1)).isoformat(),
+                "timestamp": (now - _STATUS_CHANGED_AGE).isoformat(),
                 "action": "STATUS_CHANGED",
                 "from_status": "ACTIVE",
                 "to_status": "INVESTIGATING",
                 "analyst": "john.smith",
             },
             {
-                "timestamp": (datetime.now() - timedelta(minutes=30)).isoformat(),
+                "timestamp": (now - _NOTE_ADDED_AGE).isoformat(),
                 "action": "NOTE_ADDED",
                 "analyst": "john.smith",
                 "content": "Contacting customer for verification",
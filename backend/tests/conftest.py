@@ -0,0 +1,55 @@
+"""
+Test Configuration
+==================
+Points the app at a throwaway SQLite database and provides seeded sessions.
+"""
+
+import asyncio
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+# Must be set before app.config is imported
+_DB_DIR = tempfile.mkdtemp(prefix="anomaly-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_DIR}/test.db"
+
+import pytest_asyncio
+
+from app.config import settings
+from app.db.models import AlertModel
+from app.db.session import Base, close_db, engine, get_db_session, init_db
+from app.models.enums import AlertSeverity, AlertStatus, EntityType
+from app.services import investigation_service
+
+
+@pytest_asyncio.fixture
+async def db():
+    """Fresh schema per test; module-level background state is reset too."""
+    investigation_service._background_tasks.clear()
+    investigation_service._pending_notes.clear()
+    investigation_service._note_flush_task = None
+    investigation_service._note_write_lock = asyncio.Lock()
+    investigation_service._db_session_slots = asyncio.Semaphore(settings.DATABASE_POOL_SIZE)
+    await init_db()
+    yield
+    await investigation_service.drain_note_buffer()
+    await investigation_service.drain_background_tasks()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await close_db()
+
+
+async def seed_alerts(*statuses: AlertStatus, start: datetime = datetime(2024, 1, 1)) -> None:
+    """Insert alerts ALT-000, ALT-001, ... with the given statuses, one minute apart."""
+    async with get_db_session() as session:
+        for i, status in enumerate(statuses):
+            session.add(AlertModel(
+                alert_id=f"ALT-{i:03d}",
+                entity=f"User #{i}",
+                entity_type=EntityType.USER,
+                risk_score=90.0,
+                severity=AlertSeverity.HIGH,
+                status=status,
+                detection_time=start + timedelta(minutes=i),
+            ))
+
@@ -0,0 +1,143 @@
+"""
+Alert Service Tests
+===================
+Alert list and bulk status endpoints against a real (SQLite) database.
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+
+from app.core.errors import ValidationError
+from app.db.models import AlertModel
+from app.db.repositories.alert_repository import AlertRepository
+from app.db.repositories.transaction_repository import TransactionRepository
+from app.db.session import get_db_session
+from app.main import app
+from app.models.enums import AlertStatus
+from app.models.schemas import AlertFilters
+from app.services.alert_service import AlertService
+from tests.conftest import seed_alerts
+
+
+def _client() -> AsyncClient:
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def _statuses() -> dict:
+    async with get_db_session() as session:
+        rows = await session.execute(select(AlertModel.alert_id, AlertModel.status))
+        return dict(rows.all())
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_update_applies_valid_changes(db):
+    await seed_alerts(AlertStatus.ACTIVE, AlertStatus.INVESTIGATING, AlertStatus.RESOLVED)
+    
+    async with _client() as client:
+        response = await client.patch("/api/alerts/status", json={"updates": [
+            {"alert_id": "ALT-000", "status": "INVESTIGATING"},
+            {"alert_id": "ALT-001", "status": "FALSE_POSITIVE"},
+            {"alert_id": "ALT-002", "status": "INVESTIGATING"},
+            {"alert_id": "ALT-404", "status": "RESOLVED"},
+        ]})
+    
+    assert response.status_code == 200
+    body = response.json()
+    assert body["updated"] == ["ALT-000", "ALT-001"]
+    assert sorted(body["rejected"]) == ["ALT-002", "ALT-404"]
+    assert await _statuses() == {
+        "ALT-000": AlertStatus.INVESTIGATING,
+        "ALT-001": AlertStatus.FALSE_POSITIVE,
+        "ALT-002": AlertStatus.RESOLVED,
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_update_rejects_duplicate_alert_ids(db):
+    await seed_alerts(AlertStatus.ACTIVE)
+    
+    async with _client() as client:
+        response = await client.patch("/api/alerts/status", json={"updates": [
+            {"alert_id": "ALT-000", "status": "INVESTIGATING"},
+            {"alert_id": "ALT-000", "status": "RESOLVED"},
+        ]})
+    
+    assert response.status_code == 422
+    assert "ALT-000" in response.text
+    assert await _statuses() == {"ALT-000": AlertStatus.ACTIVE}
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_service_rejects_duplicates_without_a_session():
+    service = AlertService(alert_repo=AlertRepository(), transaction_repo=TransactionRepository())
+    
+    with pytest.raises(ValidationError):
+        await service.bulk_update_status([
+            ("ALT-001", AlertStatus.INVESTIGATING),
+            ("ALT-001", AlertStatus.RESOLVED),
+        ])
+
+
+@pytest.mark.asyncio
+async def test_cursor_walk_visits_every_alert_once(db):
+    await seed_alerts(*[AlertStatus.ACTIVE] * 7)
+    
+    seen = []
+    pages = []
+    async with _client() as client:
+        params = {"limit": 3}
+        while True:
+            response = await client.get("/api/alerts", params=params)
+            assert response.status_code == 200
+            body = response.json()
+            seen += [a["alert_id"] for a in body["data"]]
+            pages.append(body["pagination"])
+            if not body["pagination"]["has_next"]:
+                break
+            params = {"limit": 3, "cursor": body["pagination"]["next_cursor"]}
+    
+    assert seen == [f"ALT-{i:03d}" for i in reversed(range(7))]
+    assert len(pages) == 3
+    assert pages[0]["total_records"] == 7
+    # Cursor pages skip the count
+    assert all(p["total_records"] is None for p in pages[1:])
+    assert pages[-1]["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_last_page_has_no_next_cursor(db):
+    await seed_alerts(AlertStatus.ACTIVE, AlertStatus.ACTIVE)
+    
+    async with _client() as client:
+        response = await client.get("/api/alerts", params={"limit": 2})
+    
+    pagination = response.json()["pagination"]
+    assert pagination["has_next"] is False
+    assert pagination["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(db):
+    async with _client() as client:
+        response = await client.get("/api/alerts", params={"cursor": "not-a-cursor"})
+    
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_mock_cursor_survives_snapshot_rebuild():
+    service = AlertService(alert_repo=AlertRepository(), transaction_repo=TransactionRepository())
+    expected = [a.alert_id for a in (await service.get_alerts(AlertFilters(limit=100))).alerts]
+    
+    seen = []
+    cursor = None
+    while True:
+        result = await service.get_alerts(AlertFilters(limit=4, cursor=cursor))
+        seen += [a.alert_id for a in result.alerts]
+        cursor = result.pagination.next_cursor
+        if cursor is None:
+            break
+        AlertService._mock_alert_index.cache_clear()
+    
+    assert seen == expected
@@ -0,0 +1,182 @@
+"""
+Investigation Service Tests
+===========================
+Decision feedback and note buffering against a real (SQLite) database.
+"""
+
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+
+from app.db.models import AlertModel, FeedbackModel, InvestigationModel
+from app.db.repositories.alert_repository import AlertRepository
+from app.db.repositories.feedback_repository import FeedbackRepository
+from app.db.repositories.transaction_repository import TransactionRepository
+from app.db.session import async_session_factory, get_db_session
+from app.main import app
+from app.models.enums import (
+    AlertStatus,
+    FeedbackDecision,
+    InvestigationAction,
+    InvestigationDecision,
+)
+from app.services import investigation_service
+from app.services.investigation_service import InvestigationService
+from tests.conftest import seed_alerts
+
+
+def _service(session) -> InvestigationService:
+    return InvestigationService(
+        alert_repo=AlertRepository(session),
+        transaction_repo=TransactionRepository(session),
+        feedback_repo=FeedbackRepository(session),
+    )
+
+
+async def _count(model) -> int:
+    async with get_db_session() as session:
+        return (await session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_committed_decision_writes_one_feedback_row(db):
+    await seed_alerts(AlertStatus.ACTIVE)
+    
+    async with get_db_session() as session:
+        result = await _service(session).submit_decision(
+            "ALT-000", InvestigationDecision.FRAUD, notes="confirmed", analyst_id="ann"
+        )
+        # Nothing is spawned until the request transaction commits
+        assert not investigation_service._background_tasks
+    await investigation_service.drain_background_tasks()
+    
+    assert result.new_status == AlertStatus.RESOLVED
+    async with get_db_session() as session:
+        rows = (await session.execute(select(FeedbackModel))).scalars().all()
+        alert = (await session.execute(select(AlertModel))).scalar_one()
+    assert [(f.decision, f.analyst_id, f.alert_id) for f in rows] == [
+        (FeedbackDecision.FRAUD, "ann", alert.id)
+    ]
+    assert alert.status == AlertStatus.RESOLVED
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_decision_writes_no_feedback(db):
+    await seed_alerts(AlertStatus.ACTIVE)
+    
+    session = async_session_factory()
+    try:
+        await _service(session).submit_decision("ALT-000", InvestigationDecision.LEGITIMATE)
+        await session.rollback()
+    finally:
+        await session.close()
+    await investigation_service.drain_background_tasks()
+    
+    assert await _count(FeedbackModel) == 0
+    assert await _count(InvestigationModel) == 0
+    async with get_db_session() as session:
+        alert = (await session.execute(select(AlertModel))).scalar_one()
+    assert alert.status == AlertStatus.ACTIVE
+
+
+@pytest.mark.asyncio
+async def test_review_decision_records_no_feedback(db):
+    await seed_alerts(AlertStatus.ACTIVE)
+    
+    async with get_db_session() as session:
+        await _service(session).submit_decision("ALT-000", InvestigationDecision.REVIEW)
+    await investigation_service.drain_background_tasks()
+    
+    assert await _count(FeedbackModel) == 0
+    assert await _count(InvestigationModel) == 1
+
+
+@pytest.mark.asyncio
+async def test_decision_route_uses_the_request_session(db):
+    await seed_alerts(AlertStatus.ACTIVE, AlertStatus.RESOLVED)
+    
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        ok = await client.post("/api/investigations/ALT-000/decision", json={"decision": "FRAUD"})
+        closed = await client.post("/api/investigations/ALT-001/decision", json={"decision": "FRAUD"})
+    await investigation_service.drain_background_tasks()
+    
+    assert ok.status_code == 200
+    assert ok.json()["updated_status"] == "RESOLVED"
+    # The second alert is already closed, so its request rolls back
+    assert closed.status_code == 400
+    assert await _count(FeedbackModel) == 1
+
+
+async def _notes() -> list:
+    async with get_db_session() as session:
+        rows = await session.execute(
+            select(InvestigationModel.notes)
+            .where(InvestigationModel.action == InvestigationAction.NOTE_ADDED)
+            .order_by(InvestigationModel.created_at, InvestigationModel.notes)
+        )
+        return list(rows.scalars())
+
+
+@pytest.mark.asyncio
+async def test_note_burst_is_written_in_one_batch(db, monkeypatch):
+    await seed_alerts(AlertStatus.ACTIVE, AlertStatus.ACTIVE)
+    batches = []
+    add_notes = AlertRepository.add_notes
+    
+    async def counting_add_notes(self, notes):
+        batches.append(len(notes))
+        return await add_notes(self, notes)
+    
+    monkeypatch.setattr(AlertRepository, "add_notes", counting_add_notes)
+    monkeypatch.setattr(investigation_service, "NOTE_FLUSH_DELAY_SECONDS", 0.01)
+    
+    async with get_db_session() as session:
+        service = _service(session)
+        for i in range(3):
+            await service.add_note("ALT-000", f"note {i}")
+        await service.add_note("ALT-001", "note 3")
+    await asyncio.sleep(0.05)
+    
+    assert batches == [4]
+    assert sorted(await _notes()) == ["note 0", "note 1", "note 2", "note 3"]
+
+
+@pytest.mark.asyncio
+async def test_drain_note_buffer_writes_before_the_timer(db, monkeypatch):
+    await seed_alerts(AlertStatus.ACTIVE)
+    monkeypatch.setattr(investigation_service, "NOTE_FLUSH_DELAY_SECONDS", 60)
+    
+    async with get_db_session() as session:
+        await _service(session).add_note("ALT-000", "pending")
+    assert await _notes() == []
+    
+    await investigation_service.drain_note_buffer()
+    
+    assert await _notes() == ["pending"]
+    assert investigation_service._note_flush_task is None
+    assert not investigation_service._pending_notes
+
+
+@pytest.mark.asyncio
+async def test_failed_note_batch_is_retried(db, monkeypatch):
+    await seed_alerts(AlertStatus.ACTIVE)
+    add_notes = AlertRepository.add_notes
+    failures = [RuntimeError("database unavailable")]
+    
+    async def flaky_add_notes(self, notes):
+        if failures:
+            raise failures.pop()
+        return await add_notes(self, notes)
+    
+    monkeypatch.setattr(AlertRepository, "add_notes", flaky_add_notes)
+    monkeypatch.setattr(investigation_service, "NOTE_FLUSH_DELAY_SECONDS", 0.01)
+    monkeypatch.setattr(investigation_service, "NOTE_RETRY_DELAY_SECONDS", 0.01)
+    
+    async with get_db_session() as session:
+        await _service(session).add_note("ALT-000", "kept")
+    await asyncio.sleep(0.1)
+    
+    assert await _notes() == ["kept"]